@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 import argparse
-import copy
+import atexit
+import gzip
+import hashlib
 import json
 import logging
+import operator
 import os
 import re
+import socket
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from datetime import datetime, timezone
+from http.client import HTTPConnection, HTTPSConnection
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.error import HTTPError, URLError
-from urllib.parse import parse_qs, unquote, urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import parse_qsl, unquote, urljoin, urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 API_BASES = [base.strip() for base in os.environ.get(
     'STREAM_API_BASES',
@@ -20,9 +35,29 @@ API_BASES = [base.strip() for base in os.environ.get(
 ).split(',') if base.strip()]
 
 CACHE_TTL_SEC = int(os.environ.get('CACHE_TTL_SEC', '30'))
+# Serialized /games responses are reusable while the snapshot and query
+# knobs are unchanged; kept short so health annotations stay fresh.
+GAMES_RESPONSE_TTL_SEC = int(os.environ.get('GAMES_RESPONSE_TTL_SEC', '5'))
+# Bodies above this size are gzipped when the client accepts it; small
+# ones are not worth the header overhead.
+GZIP_MIN_BYTES = int(os.environ.get('GZIP_MIN_BYTES', '1024'))
+# Accepted spellings for boolean query flags like force/includeHealth.
+TRUE_VALUES = frozenset(('1', 'true', 'yes'))
+# >1 forks that many SO_REUSEPORT worker processes so the kernel spreads
+# accepts across cores. Each worker keeps its own caches, so upstream
+# refreshes are duplicated per worker; the default stays single-process.
+SERVICE_WORKERS = int(os.environ.get('SERVICE_WORKERS', '1'))
 CACHE_STALE_SEC = int(os.environ.get('CACHE_STALE_SEC', '600'))
 HEALTH_TTL_SEC = int(os.environ.get('HEALTH_TTL_SEC', '120'))
 MAX_HEALTH_CHECKS = int(os.environ.get('MAX_HEALTH_CHECKS', '10'))
+HEALTH_CHECK_WORKERS = int(os.environ.get('HEALTH_CHECK_WORKERS', '16'))
+# Entries older than this are refreshed in the background so requests
+# keep hitting a warm health cache.
+HEALTH_REFRESH_AGE_SEC = int(HEALTH_TTL_SEC * 0.8)
+# Load balancers hammer /health; reuse the serialized body for a second
+# instead of taking the snapshot lock and re-encoding per probe.
+HEALTH_BODY_TTL_SEC = 1.0
+HEALTH_BODY_CACHE = {'ts': 0.0, 'body': None}
 REQUEST_TIMEOUT_SEC = int(os.environ.get('REQUEST_TIMEOUT_SEC', '10'))
 RETRY_COUNT = int(os.environ.get('RETRY_COUNT', '3'))
 BACKOFF_BASE_SEC = float(os.environ.get('BACKOFF_BASE_SEC', '0.6'))
@@ -110,6 +145,22 @@ CORE_SPORTS = {
     'mlb': 'baseball',
     'nhl': 'hockey'
 }
+CORE_SEASONS_URLS = {
+    league: f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons"
+    for league, sport in CORE_SPORTS.items()
+}
+CORE_TEAMS_URL_TEMPLATES = {
+    league: f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{{year}}/teams?limit=200"
+    for league, sport in CORE_SPORTS.items()
+}
+CORE_ROSTER_URL_TEMPLATES = {
+    league: f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{{year}}/teams/{{team_id}}/athletes?limit=200"
+    for league, sport in CORE_SPORTS.items()
+}
+CORE_LEADERS_URL_TEMPLATES = {
+    league: f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{{year}}/types/{{season_type}}/leaders"
+    for league, sport in CORE_SPORTS.items()
+}
 STATS_CACHE_TTL_SEC = int(os.environ.get('STATS_CACHE_TTL_SEC', '60'))
 PLAYER_LEADERS_CACHE_TTL_SEC = int(os.environ.get('PLAYER_LEADERS_CACHE_TTL_SEC', '900'))
 PLAYER_INDEX_CACHE_TTL_SEC = int(os.environ.get('PLAYER_INDEX_CACHE_TTL_SEC', '3600'))
@@ -117,13 +168,25 @@ PLAYER_PROFILE_CACHE_TTL_SEC = int(os.environ.get('PLAYER_PROFILE_CACHE_TTL_SEC'
 PLAYER_STATS_CACHE_TTL_SEC = int(os.environ.get('PLAYER_STATS_CACHE_TTL_SEC', '900'))
 PLAYER_PAGE_CACHE_TTL_SEC = int(os.environ.get('PLAYER_PAGE_CACHE_TTL_SEC', '120'))
 PLAYER_FETCH_WORKERS = int(os.environ.get('PLAYER_FETCH_WORKERS', '12'))
+PLAYER_CACHE_MAXSIZE = int(os.environ.get('PLAYER_CACHE_MAXSIZE', '10000'))
+PLAYER_NEGATIVE_TTL_SEC = int(os.environ.get('PLAYER_NEGATIVE_TTL_SEC', '30'))
+SEASON_CANDIDATES_TTL_SEC = int(os.environ.get('SEASON_CANDIDATES_TTL_SEC', '600'))
+CORE_REF_CACHE_TTL_SEC = int(os.environ.get('CORE_REF_CACHE_TTL_SEC', '120'))
 STREAMED_IMAGE_BASE = os.environ.get('STREAMED_IMAGE_BASE', 'https://streamed.pk')
+STREAMED_IMAGE_ROOT = STREAMED_IMAGE_BASE.rstrip('/')
+STREAMED_IMAGE_EXTS = ('.webp', '.png', '.jpg', '.jpeg', '.svg')
 TEAM_CACHE_TTL_SEC = int(os.environ.get('TEAM_CACHE_TTL_SEC', '43200'))
 TEAM_CACHE_STALE_SEC = int(os.environ.get('TEAM_CACHE_STALE_SEC', '604800'))
 STANDINGS_CACHE_TTL_SEC = int(os.environ.get('STANDINGS_CACHE_TTL_SEC', '1800'))
 STANDINGS_CACHE_STALE_SEC = int(os.environ.get('STANDINGS_CACHE_STALE_SEC', '21600'))
 LIVE_MAX_AGE_SEC = int(os.environ.get('LIVE_MAX_AGE_SEC', '14400'))
 ENDED_GRACE_SEC = int(os.environ.get('ENDED_GRACE_SEC', '21600'))
+LIVE_CUTOFF_MS = LIVE_MAX_AGE_SEC * 1000
+ENDED_GRACE_MS = ENDED_GRACE_SEC * 1000
+PERSIST_DEBOUNCE_SEC = float(os.environ.get('PERSIST_DEBOUNCE_SEC', '5'))
+# Sized to the fetch fan-out so a fully parallel roster crawl can keep
+# every worker on a reused connection.
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', str(PLAYER_FETCH_WORKERS * 2)))
 
 GLOBAL_EXCLUDED_KEYWORDS = []
 
@@ -203,8 +266,53 @@ LEAGUE_CONFIGS = {
     }
 }
 
+SLUG_RE = re.compile(r'[^a-z0-9\-_]+')
+NON_DIGIT_RE = re.compile(r'[^0-9]')
+TEAM_NAME_RE = re.compile(r'[^a-z0-9 ]')
+WHITESPACE_RE = re.compile(r'\s+')
+TEAM_ALIAS_RE = re.compile(r'&|st\.|saint')
+TEAM_ALIASES = {'&': 'and', 'st.': 'st', 'saint': 'st'}
+SEASON_YEAR_RE = re.compile(r'/seasons/([0-9]{4})')
+
+
+def compile_keyword_search(keywords):
+    if not keywords:
+        return None
+    pattern = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def compile_keyword_counter(keywords):
+    # Zero-width lookahead so overlapping keywords ('blazers' inside
+    # 'trail blazers') are each still counted, matching the old
+    # per-keyword substring scan.
+    if not keywords:
+        return None
+    pattern = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({pattern}))")
+
+
+LEAGUE_MATCHERS = {
+    league_key: {
+        'categories': compile_keyword_search(config['categories']),
+        'exclude': compile_keyword_search(GLOBAL_EXCLUDED_KEYWORDS + config['exclude_keywords']),
+        'brand': compile_keyword_search(config['brand_keywords']),
+        'team': compile_keyword_counter(config['team_keywords'])
+    }
+    for league_key, config in LEAGUE_CONFIGS.items()
+}
+
 PRIORITY_LEAGUES = ['nfl', 'nba', 'mlb', 'nhl']
 SOURCE_PREFERENCE = ['admin', 'delta', 'charlie', 'echo', 'golf', 'alpha', 'bravo']
+SOURCE_RANK = {name: index for index, name in enumerate(SOURCE_PREFERENCE)}
+SOURCE_RANK_DEFAULT = len(SOURCE_PREFERENCE)
+HEALTH_SCORE = {'up': 0, 'unknown': 1, 'down': 2}
+PRIORITY_LEAGUE_RANK = {league: index for index, league in enumerate(PRIORITY_LEAGUES)}
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 CACHE_PATH = os.path.join(DATA_DIR, 'games_cache.json')
@@ -220,49 +328,83 @@ logging.basicConfig(
 )
 
 
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dump_bytes = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dump_bytes(payload):
+        return json.dumps(payload).encode('utf-8')
+
+
 def now_ms():
     return int(time.time() * 1000)
 
 
+# Timestamps in health payloads are only read at second resolution, so
+# format the ISO string once per second instead of per probe.
+NOW_ISO_CACHE = ['', 0]
+
+
+def now_iso():
+    second = int(time.time())
+    if second != NOW_ISO_CACHE[1]:
+        NOW_ISO_CACHE[0] = datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+        NOW_ISO_CACHE[1] = second
+    return NOW_ISO_CACHE[0]
+
+
 def iso_from_ms(timestamp_ms):
     try:
         return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).isoformat()
     except Exception:
-        return datetime.now(tz=timezone.utc).isoformat()
+        return now_iso()
 
 
+@lru_cache(maxsize=4096)
 def sanitize_slug(value):
     if not value:
         return ''
-    return re.sub(r'[^a-z0-9\-_]', '', str(value).lower())
+    return SLUG_RE.sub('', str(value).lower())
 
 
 def is_league_match(match, league):
-    config = LEAGUE_CONFIGS.get(league)
-    if not config:
-        return False
+    # Pure in the three string fields, and each refresh classifies the
+    # same matches against up to four leagues, so the real work lives in
+    # a memoized helper. No staleness concern: the matchers are static.
+    return _is_league_match_cached(
+        match.get('title', ''),
+        match.get('id', ''),
+        (match.get('category') or '').lower(),
+        league
+    )
 
-    category = (match.get('category') or '').lower()
-    search_text = f"{match.get('title', '')} {match.get('id', '')}".lower()
 
-    if category and not any(cat in category for cat in config['categories']):
+@lru_cache(maxsize=8192)
+def _is_league_match_cached(title, match_id, category, league):
+    matcher = LEAGUE_MATCHERS.get(league)
+    if not matcher:
         return False
 
-    if any(keyword in search_text for keyword in GLOBAL_EXCLUDED_KEYWORDS):
-        return False
+    search_text = f"{title} {match_id}".lower()
 
-    if any(keyword in search_text for keyword in config['exclude_keywords']):
+    if category and matcher['categories'] and not matcher['categories'].search(category):
         return False
 
-    if any(keyword in search_text for keyword in config['brand_keywords']):
-        return True
+    if matcher['exclude'] and matcher['exclude'].search(search_text):
+        return False
 
-    nickname_hits = sum(1 for nickname in config['team_keywords'] if nickname in search_text)
-    if nickname_hits >= 2:
+    if matcher['brand'] and matcher['brand'].search(search_text):
         return True
 
-    if category and league in category and nickname_hits >= 1:
-        return True
+    if matcher['team']:
+        needed_hits = 1 if category and league in category else 2
+        nicknames = set()
+        for found in matcher['team'].finditer(search_text):
+            nicknames.add(found.group(1))
+            if len(nicknames) >= needed_hits:
+                return True
 
     return False
 
@@ -271,6 +413,10 @@ class GameCache:
     def __init__(self, cache_path):
         self.lock = threading.Lock()
         self.cache_path = cache_path
+        self.flush_timer = None
+        # Memoized build_games_for_* output, keyed by (league, last_fetch);
+        # thrown away whenever update() publishes a new snapshot.
+        self.derived = {}
         self.data = {
             'live': [],
             'all': [],
@@ -279,47 +425,93 @@ class GameCache:
             'last_source': None
         }
         self._load()
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
 
     def _load(self):
         if not os.path.exists(self.cache_path):
             return
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as handle:
-                payload = json.load(handle)
+            with open(self.cache_path, 'rb') as handle:
+                payload = json_loads(handle.read())
             if isinstance(payload, dict):
                 self.data.update(payload)
         except Exception as exc:
             logging.warning('Failed to load cache: %s', exc)
 
-    def _save(self):
-        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-        temp_path = f"{self.cache_path}.tmp"
-        with open(temp_path, 'w', encoding='utf-8') as handle:
-            json.dump(self.data, handle)
+    def _schedule_flush(self):
+        # Caller holds self.lock. Debounce so a busy refresh cycle costs
+        # at most one disk write per window instead of one per update.
+        if self.flush_timer is not None:
+            return
+        timer = threading.Timer(PERSIST_DEBOUNCE_SEC, self._flush)
+        timer.daemon = True
+        self.flush_timer = timer
+        timer.start()
+
+    def _flush(self):
+        with self.lock:
+            self.flush_timer = None
+            data = self.data
+        try:
+            self._save(data)
+        except Exception as exc:
+            logging.warning('Failed to persist cache %s: %s', self.cache_path, exc)
+
+    def _save(self, data):
+        # Per-pid tmp name so SERVICE_WORKERS processes flushing at the
+        # same time never interleave writes; os.replace stays atomic.
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as handle:
+            # live_ids and league_index are derived from 'live'/'all';
+            # rebuilt on update, not persisted.
+            handle.write(json_dump_bytes(
+                {k: v for k, v in data.items() if k not in ('live_ids', 'league_index')}
+            ))
         os.replace(temp_path, self.cache_path)
 
     def snapshot(self):
+        # Published snapshots are never mutated after update() rebinds
+        # self.data, so handing out the reference is safe.
         with self.lock:
-            return copy.deepcopy(self.data)
+            return self.data
 
     def update(self, live_games, upcoming_games, source):
+        # Identify each match's league once per refresh; build_games_for_all
+        # otherwise re-runs the matcher scan for every request.
+        league_index = {}
+        for match in live_games:
+            match_id = match.get('id')
+            if match_id:
+                league_index[match_id] = identify_match_league(match)
+        for match in upcoming_games:
+            match_id = match.get('id')
+            if match_id and match_id not in league_index:
+                league_index[match_id] = identify_match_league(match)
         with self.lock:
-            self.data['live'] = live_games
-            self.data['all'] = upcoming_games
-            self.data['last_fetch'] = int(time.time())
-            self.data['last_error'] = None
-            self.data['last_source'] = source
-            self._save()
+            self.data = {
+                **self.data,
+                'live': live_games,
+                'all': upcoming_games,
+                # Derived once per refresh instead of per request.
+                'live_ids': {mid for mid in (m.get('id') for m in live_games) if mid},
+                'league_index': league_index,
+                'last_fetch': int(time.time()),
+                'last_error': None,
+                'last_source': source
+            }
+            self.derived = {}
+            self._schedule_flush()
 
     def mark_error(self, error_message):
         with self.lock:
-            self.data['last_error'] = error_message
+            self.data = {**self.data, 'last_error': error_message}
 
 
 class TeamCache:
     def __init__(self, cache_path):
         self.lock = threading.Lock()
         self.cache_path = cache_path
+        self.flush_timer = None
         self.data = {
             'teams': [],
             'last_fetch': 0,
@@ -327,46 +519,71 @@ class TeamCache:
             'last_source': None
         }
         self._load()
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
 
     def _load(self):
         if not os.path.exists(self.cache_path):
             return
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as handle:
-                payload = json.load(handle)
+            with open(self.cache_path, 'rb') as handle:
+                payload = json_loads(handle.read())
             if isinstance(payload, dict):
                 self.data.update(payload)
         except Exception as exc:
             logging.warning('Failed to load team cache: %s', exc)
 
-    def _save(self):
-        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-        temp_path = f"{self.cache_path}.tmp"
-        with open(temp_path, 'w', encoding='utf-8') as handle:
-            json.dump(self.data, handle)
+    def _schedule_flush(self):
+        # Caller holds self.lock. Debounce so a busy refresh cycle costs
+        # at most one disk write per window instead of one per update.
+        if self.flush_timer is not None:
+            return
+        timer = threading.Timer(PERSIST_DEBOUNCE_SEC, self._flush)
+        timer.daemon = True
+        self.flush_timer = timer
+        timer.start()
+
+    def _flush(self):
+        with self.lock:
+            self.flush_timer = None
+            data = self.data
+        try:
+            self._save(data)
+        except Exception as exc:
+            logging.warning('Failed to persist cache %s: %s', self.cache_path, exc)
+
+    def _save(self, data):
+        # Per-pid tmp name so SERVICE_WORKERS processes flushing at the
+        # same time never interleave writes; os.replace stays atomic.
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as handle:
+            handle.write(json_dump_bytes(data))
         os.replace(temp_path, self.cache_path)
 
     def snapshot(self):
         with self.lock:
-            return copy.deepcopy(self.data)
+            return self.data
 
     def update(self, teams, source):
         with self.lock:
-            self.data['teams'] = teams
-            self.data['last_fetch'] = int(time.time())
-            self.data['last_error'] = None
-            self.data['last_source'] = source
-            self._save()
+            self.data = {
+                **self.data,
+                'teams': teams,
+                'last_fetch': int(time.time()),
+                'last_error': None,
+                'last_source': source
+            }
+            self._schedule_flush()
 
     def mark_error(self, error_message):
         with self.lock:
-            self.data['last_error'] = error_message
+            self.data = {**self.data, 'last_error': error_message}
 
 
 class StandingsCache:
     def __init__(self, cache_path):
         self.lock = threading.Lock()
         self.cache_path = cache_path
+        self.flush_timer = None
         self.data = {
             'standings': [],
             'last_fetch': 0,
@@ -374,80 +591,170 @@ class StandingsCache:
             'last_source': None
         }
         self._load()
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
 
     def _load(self):
         if not os.path.exists(self.cache_path):
             return
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as handle:
-                payload = json.load(handle)
+            with open(self.cache_path, 'rb') as handle:
+                payload = json_loads(handle.read())
             if isinstance(payload, dict):
                 self.data.update(payload)
         except Exception as exc:
             logging.warning('Failed to load standings cache: %s', exc)
 
-    def _save(self):
-        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-        temp_path = f"{self.cache_path}.tmp"
-        with open(temp_path, 'w', encoding='utf-8') as handle:
-            json.dump(self.data, handle)
+    def _schedule_flush(self):
+        # Caller holds self.lock. Debounce so a busy refresh cycle costs
+        # at most one disk write per window instead of one per update.
+        if self.flush_timer is not None:
+            return
+        timer = threading.Timer(PERSIST_DEBOUNCE_SEC, self._flush)
+        timer.daemon = True
+        self.flush_timer = timer
+        timer.start()
+
+    def _flush(self):
+        with self.lock:
+            self.flush_timer = None
+            data = self.data
+        try:
+            self._save(data)
+        except Exception as exc:
+            logging.warning('Failed to persist cache %s: %s', self.cache_path, exc)
+
+    def _save(self, data):
+        # Per-pid tmp name so SERVICE_WORKERS processes flushing at the
+        # same time never interleave writes; os.replace stays atomic.
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as handle:
+            handle.write(json_dump_bytes(data))
         os.replace(temp_path, self.cache_path)
 
     def snapshot(self):
         with self.lock:
-            return copy.deepcopy(self.data)
+            return self.data
 
     def update(self, standings, source):
         with self.lock:
-            self.data['standings'] = standings
-            self.data['last_fetch'] = int(time.time())
-            self.data['last_error'] = None
-            self.data['last_source'] = source
-            self._save()
+            self.data = {
+                **self.data,
+                'standings': standings,
+                'last_fetch': int(time.time()),
+                'last_error': None,
+                'last_source': source
+            }
+            self._schedule_flush()
 
     def mark_error(self, error_message):
         with self.lock:
-            self.data['last_error'] = error_message
+            self.data = {**self.data, 'last_error': error_message}
 
 
-class HealthCache:
-    def __init__(self, ttl_sec):
-        self.ttl_sec = ttl_sec
+class TTLCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
         self.lock = threading.Lock()
         self.data = {}
 
-    def get(self, key):
+    def get_with_age(self, key):
+        if not key:
+            return None, None
         with self.lock:
-            record = self.data.get(key)
-            if not record:
-                return None
-            if time.time() - record['checked_at'] > self.ttl_sec:
-                return None
-            return copy.deepcopy(record['payload'])
+            entry = self.data.get(key)
+            if not entry:
+                return None, None
+            age = time.time() - entry['ts']
+            if age > entry.get('ttl', self.ttl):
+                del self.data[key]
+                return None, None
+            return entry['data'], int(age)
 
-    def set(self, key, payload):
+    def get(self, key):
+        return self.get_with_age(key)[0]
+
+    def set(self, key, payload, ttl=None):
+        if not key:
+            return
+        entry = {
+            'ts': time.time(),
+            'data': payload
+        }
+        if ttl is not None:
+            entry['ttl'] = ttl
         with self.lock:
-            self.data[key] = {
-                'checked_at': time.time(),
-                'payload': copy.deepcopy(payload)
-            }
+            self.data.pop(key, None)
+            if len(self.data) >= self.maxsize:
+                self._evict()
+            self.data[key] = entry
+
+    def _evict(self):
+        # Caller holds the lock. Drop expired entries first; if still
+        # full, drop the oldest writes (dicts preserve write order).
+        now = time.time()
+        expired = [
+            key for key, entry in self.data.items()
+            if now - entry['ts'] > entry.get('ttl', self.ttl)
+        ]
+        for key in expired:
+            del self.data[key]
+        while len(self.data) >= self.maxsize:
+            del self.data[next(iter(self.data))]
 
 
 GAME_CACHE = GameCache(CACHE_PATH)
 TEAM_CACHES = {league: TeamCache(path) for league, path in TEAM_CACHE_PATHS.items()}
 STANDINGS_CACHES = {}
-HEALTH_CACHE = HealthCache(HEALTH_TTL_SEC)
-STATS_CACHE = {}
-PLAYER_LEADERS_CACHE = {}
-PLAYER_INDEX_CACHE = {}
-PLAYER_PROFILE_CACHE = {}
-PLAYER_STATS_CACHE = {}
-PLAYER_PAGE_CACHE = {}
+HEALTH_CACHE = TTLCache(maxsize=2048, ttl=HEALTH_TTL_SEC)
+STATS_CACHE = TTLCache(maxsize=512, ttl=STATS_CACHE_TTL_SEC)
+# Matchup -> ESPN event id, so repeat /stats requests skip the
+# scoreboard round-trip; same lifetime as the stats payloads.
+EVENT_ID_CACHE = TTLCache(maxsize=512, ttl=STATS_CACHE_TTL_SEC)
+PLAYER_LEADERS_CACHE = TTLCache(maxsize=256, ttl=PLAYER_LEADERS_CACHE_TTL_SEC)
+PLAYER_INDEX_CACHE = TTLCache(maxsize=64, ttl=PLAYER_INDEX_CACHE_TTL_SEC)
+SEASON_CANDIDATES_CACHE = TTLCache(maxsize=32, ttl=SEASON_CANDIDATES_TTL_SEC)
+# Process-wide L2 behind the per-request ref caches; short TTL since
+# stats refs move while games are live.
+CORE_REF_CACHE = TTLCache(maxsize=8192, ttl=CORE_REF_CACHE_TTL_SEC)
+# Failed lookups are cached briefly under this marker so bursts of
+# concurrent requests do not re-hit ESPN after an upstream error.
+NEGATIVE_SENTINEL = object()
+
+# Singleflight map: concurrent fetches of the same ref coalesce onto
+# one upstream request; losers wait on the winner's event and re-read
+# the cache.
+PLAYER_INFLIGHT = {}
+PLAYER_INFLIGHT_LOCK = threading.Lock()
+
+
+def acquire_inflight(key):
+    with PLAYER_INFLIGHT_LOCK:
+        event = PLAYER_INFLIGHT.get(key)
+        if event is None:
+            PLAYER_INFLIGHT[key] = threading.Event()
+            return None
+        return event
+
+
+def release_inflight(key):
+    with PLAYER_INFLIGHT_LOCK:
+        event = PLAYER_INFLIGHT.pop(key, None)
+    if event is not None:
+        event.set()
 
-PLAYER_INDEX_LOCK = threading.Lock()
-PLAYER_PROFILE_LOCK = threading.Lock()
-PLAYER_STATS_LOCK = threading.Lock()
-PLAYER_PAGE_LOCK = threading.Lock()
+PLAYER_PROFILE_CACHE = TTLCache(maxsize=PLAYER_CACHE_MAXSIZE, ttl=PLAYER_PROFILE_CACHE_TTL_SEC)
+PLAYER_STATS_CACHE = TTLCache(maxsize=PLAYER_CACHE_MAXSIZE, ttl=PLAYER_STATS_CACHE_TTL_SEC)
+PLAYER_PAGE_CACHE = TTLCache(maxsize=1024, ttl=PLAYER_PAGE_CACHE_TTL_SEC)
+GAMES_RESPONSE_CACHE = TTLCache(maxsize=64, ttl=GAMES_RESPONSE_TTL_SEC)
+
+
+def flush_caches():
+    for cache in [GAME_CACHE, *TEAM_CACHES.values(), *STANDINGS_CACHES.values()]:
+        cache._flush()
+
+
+atexit.register(flush_caches)
 
 
 def get_standings_cache(league, season=None):
@@ -458,7 +765,7 @@ def get_standings_cache(league, season=None):
     cache = STANDINGS_CACHES.get(cache_key)
     if cache:
         return cache
-    safe_season = re.sub(r'[^0-9]', '', season_key) if season_key != 'current' else 'current'
+    safe_season = NON_DIGIT_RE.sub('', season_key) if season_key != 'current' else 'current'
     suffix = f"{league}_{safe_season}" if safe_season else league
     cache_path = os.path.join(DATA_DIR, f"standings_cache_{suffix}.json")
     cache = StandingsCache(cache_path)
@@ -466,15 +773,128 @@ def get_standings_cache(league, season=None):
     return cache
 
 
+class ConnectionPool:
+    def __init__(self, max_per_host=HTTP_POOL_MAXSIZE):
+        self.lock = threading.Lock()
+        self.max_per_host = max_per_host
+        self.connections = {}
+
+    def acquire(self, scheme, host, port):
+        key = (scheme, host, port)
+        with self.lock:
+            stack = self.connections.get(key)
+            if stack:
+                return stack.pop(), True
+        if scheme == 'https':
+            return HTTPSConnection(host, port, timeout=REQUEST_TIMEOUT_SEC), False
+        return HTTPConnection(host, port, timeout=REQUEST_TIMEOUT_SEC), False
+
+    def release(self, scheme, host, port, connection):
+        key = (scheme, host, port)
+        with self.lock:
+            stack = self.connections.setdefault(key, [])
+            if len(stack) < self.max_per_host:
+                stack.append(connection)
+                return
+        self.discard(connection)
+
+    def discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+HTTP_POOL = ConnectionPool()
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 3
+
+
+def http_get(url, headers, method='GET'):
+    for _ in range(MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        scheme = parsed.scheme or 'https'
+        host = parsed.hostname
+        port = parsed.port
+        path = parsed.path or '/'
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        status = None
+        response_headers = None
+        body = None
+        for fresh_only in (False, True):
+            connection, reused = HTTP_POOL.acquire(scheme, host, port)
+            # The retry pass must actually get a fresh socket: drain any
+            # remaining pooled (possibly idle-dead) connections for this
+            # host until acquire falls through to a new one.
+            while fresh_only and reused:
+                HTTP_POOL.discard(connection)
+                connection, reused = HTTP_POOL.acquire(scheme, host, port)
+            try:
+                connection.request(method, path, headers=headers)
+                response = connection.getresponse()
+                status = response.status
+                response_headers = response.headers
+                body = response.read()
+            except Exception:
+                HTTP_POOL.discard(connection)
+                # A pooled connection may have been closed by the server
+                # between requests; retry once on a fresh socket.
+                if reused and not fresh_only:
+                    continue
+                raise
+            HTTP_POOL.release(scheme, host, port, connection)
+            break
+
+        if status in REDIRECT_STATUSES and response_headers.get('Location'):
+            # Location may be relative; resolve against the current URL
+            # like urlopen does.
+            url = urljoin(url, response_headers.get('Location'))
+            continue
+        return status, response_headers, body
+
+    raise URLError(f"Too many redirects for {url}")
+
+
+JSON_HEADERS = {'Accept': 'application/json', 'User-Agent': USER_AGENT}
+
+# url -> {'etag', 'last_modified', 'payload'} for conditional GETs; a
+# 304 revalidates the stored payload without body transfer or parse.
+CONDITIONAL_CACHE = TTLCache(
+    maxsize=256,
+    ttl=int(os.environ.get('CONDITIONAL_CACHE_TTL_SEC', '3600'))
+)
+
+
 def fetch_json(url):
     last_error = None
+    validator = CONDITIONAL_CACHE.get(url)
+    headers = JSON_HEADERS
+    if validator:
+        headers = dict(JSON_HEADERS)
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
     for attempt in range(RETRY_COUNT):
         try:
-            request = Request(url, headers={'Accept': 'application/json', 'User-Agent': USER_AGENT})
-            with urlopen(request, timeout=REQUEST_TIMEOUT_SEC) as response:
-                if response.status != 200:
-                    raise HTTPError(url, response.status, 'Bad response', response.headers, None)
-                return json.loads(response.read().decode('utf-8'))
+            status, response_headers, body = http_get(url, headers)
+            if status == 304 and validator:
+                return validator['payload']
+            if status != 200:
+                raise HTTPError(url, status, 'Bad response', response_headers, None)
+            payload = json_loads(body)
+            etag = response_headers.get('ETag')
+            last_modified = response_headers.get('Last-Modified')
+            if etag or last_modified:
+                CONDITIONAL_CACHE.set(url, {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'payload': payload
+                })
+            return payload
         except Exception as exc:
             last_error = exc
             time.sleep(BACKOFF_BASE_SEC * (2 ** attempt))
@@ -483,22 +903,67 @@ def fetch_json(url):
     raise RuntimeError('Failed to fetch JSON')
 
 
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=PLAYER_FETCH_WORKERS, thread_name_prefix='fetch')
+
+
+def fetch_many(urls):
+    results = {}
+    futures = {}
+    for url in urls:
+        if url in futures:
+            continue
+        futures[url] = FETCH_EXECUTOR.submit(fetch_json, url)
+    for url, future in futures.items():
+        try:
+            results[url] = future.result()
+        except Exception as exc:
+            logging.warning('Failed to fetch %s: %s', url, exc)
+            results[url] = None
+    return results
+
+
+# Four workers so the boot-time prewarm (teams + standings across four
+# leagues) overlaps instead of draining two at a time; steady-state
+# revalidation rarely queues more than a couple of tasks.
+REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='refresh')
+REVALIDATING = set()
+REVALIDATING_LOCK = threading.Lock()
+
+
+def start_revalidation(key, refresh_fn):
+    with REVALIDATING_LOCK:
+        if key in REVALIDATING:
+            return
+        REVALIDATING.add(key)
+
+    def run():
+        try:
+            refresh_fn()
+        except Exception as exc:
+            logging.warning('Background revalidation failed for %s: %s', key, exc)
+        finally:
+            with REVALIDATING_LOCK:
+                REVALIDATING.discard(key)
+
+    REFRESH_EXECUTOR.submit(run)
+
+
+@lru_cache(maxsize=4096)
 def normalize_team_name(value):
     if not value:
         return ''
-    normalized = str(value).lower()
-    normalized = normalized.replace('&', 'and')
-    normalized = normalized.replace('st.', 'st')
-    normalized = normalized.replace('saint', 'st')
-    normalized = re.sub(r'[^a-z0-9 ]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    return normalized
+    normalized = TEAM_ALIAS_RE.sub(
+        lambda match: TEAM_ALIASES[match.group(0)],
+        str(value).lower()
+    )
+    normalized = TEAM_NAME_RE.sub('', normalized)
+    return WHITESPACE_RE.sub(' ', normalized).strip()
 
 
 def format_scoreboard_date(value):
     if not value:
         return None
-    cleaned = re.sub(r'[^0-9]', '', value)
+    cleaned = NON_DIGIT_RE.sub('', value)
     if len(cleaned) >= 8:
         return cleaned[:8]
     return None
@@ -513,13 +978,13 @@ def fetch_espn_scoreboard(league, date_value=None):
     return fetch_json(base)
 
 
-def find_espn_event(scoreboard, away_abbr=None, home_abbr=None, away_name=None, home_name=None):
-    if not scoreboard:
-        return None
-    target_abbrs = {abbr.upper() for abbr in (away_abbr, home_abbr) if abbr}
-    target_names = {normalize_team_name(name) for name in (away_name, home_name) if name}
-    best_event = None
-    best_score = 0
+def index_scoreboard(scoreboard):
+    # Memoized on the payload so repeat lookups against the same
+    # scoreboard skip the per-competitor normalization entirely.
+    index = scoreboard.get('_events_index')
+    if index is not None:
+        return index
+    index = []
     for event in scoreboard.get('events', []):
         competitions = event.get('competitions') or []
         if not competitions:
@@ -541,13 +1006,29 @@ def find_espn_event(scoreboard, away_abbr=None, home_abbr=None, away_name=None,
                 normalized = normalize_team_name(name)
                 if normalized:
                     event_names.add(normalized)
-        if target_abbrs and target_abbrs.issubset(event_abbrs):
+        event_label = normalize_team_name(event.get('shortName') or event.get('name'))
+        index.append((frozenset(event_abbrs), frozenset(event_names), event_label, event))
+    scoreboard['_events_index'] = index
+    return index
+
+
+def find_espn_event(scoreboard, away_abbr=None, home_abbr=None, away_name=None, home_name=None):
+    if not scoreboard:
+        return None
+    target_abbrs = {abbr.upper() for abbr in (away_abbr, home_abbr) if abbr}
+    target_names = {normalize_team_name(name) for name in (away_name, home_name) if name}
+    if not target_abbrs and not target_names:
+        return None
+    best_event = None
+    best_score = 0
+    for event_abbrs, event_names, event_label, event in index_scoreboard(scoreboard):
+        if target_abbrs and target_abbrs <= event_abbrs:
             return event
-        if target_names and target_names.issubset(event_names):
+        if target_names and target_names <= event_names:
             return event
         score = 0
         if target_abbrs:
-            score += len(target_abbrs.intersection(event_abbrs)) * 3
+            score += len(target_abbrs & event_abbrs) * 3
         if target_names:
             for target in target_names:
                 for candidate in event_names:
@@ -557,7 +1038,6 @@ def find_espn_event(scoreboard, away_abbr=None, home_abbr=None, away_name=None,
                         score += 3
                     elif target in candidate or candidate in target:
                         score += 2
-        event_label = normalize_team_name(event.get('shortName') or event.get('name'))
         if event_label:
             for target in target_names:
                 if target and target in event_label:
@@ -586,18 +1066,19 @@ def normalize_core_ref(ref):
     return text
 
 
+@lru_cache(maxsize=2048)
 def extract_season_year(ref):
     if not ref:
         return None
-    match = re.search(r'/seasons/([0-9]{4})', str(ref))
+    match = SEASON_YEAR_RE.search(str(ref))
     return match.group(1) if match else None
 
 
 def fetch_core_seasons(league):
-    sport = CORE_SPORTS.get(league)
-    if not sport:
+    url = CORE_SEASONS_URLS.get(league)
+    if not url:
         return []
-    data = fetch_json(f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons")
+    data = fetch_json(url)
     items = data.get('items') or []
     refs = []
     for item in items:
@@ -615,16 +1096,24 @@ def resolve_core_season(league, season_value):
 
 def resolve_core_season_candidates(league, season_value):
     if season_value and str(season_value).lower() != 'current':
-        cleaned = re.sub(r'[^0-9]', '', str(season_value))
+        cleaned = NON_DIGIT_RE.sub('', str(season_value))
         if len(cleaned) >= 4:
             return [cleaned[:4]]
         return []
 
+    # The 'current' path hits the core seasons endpoint; the list moves
+    # once a year, so keep it for a while even when the player index
+    # cache has expired.
+    cached = SEASON_CANDIDATES_CACHE.get(league)
+    if cached is not None:
+        return cached
     candidates = []
     for ref in fetch_core_seasons(league):
         year = extract_season_year(ref)
         if year:
             candidates.append(year)
+    if candidates:
+        SEASON_CANDIDATES_CACHE.set(league, candidates)
     return candidates
 
 
@@ -634,49 +1123,32 @@ def resolve_core_payload(ref, cache):
         return None
     if url in cache:
         return cache[url]
-    try:
-        payload = fetch_json(url)
-    except Exception:
-        return None
+    payload = CORE_REF_CACHE.get(url)
+    if payload is None:
+        # Leaders often share a team ref; coalesce concurrent misses so
+        # a burst costs one round trip per distinct ref.
+        inflight_key = ('ref', url)
+        while True:
+            event = acquire_inflight(inflight_key)
+            if event is None:
+                break
+            event.wait(REQUEST_TIMEOUT_SEC)
+            payload = CORE_REF_CACHE.get(url)
+            if payload is not None:
+                cache[url] = payload
+                return payload
+        try:
+            try:
+                payload = fetch_json(url)
+            except Exception:
+                return None
+            CORE_REF_CACHE.set(url, payload)
+        finally:
+            release_inflight(inflight_key)
     cache[url] = payload
     return payload
 
 
-def get_ttl_cached(cache, lock, key, ttl):
-    if not key:
-        return None
-    with lock:
-        entry = cache.get(key)
-    if not entry:
-        return None
-    if time.time() - entry['ts'] > ttl:
-        return None
-    return entry['data']
-
-
-def set_ttl_cached(cache, lock, key, payload):
-    if not key:
-        return
-    with lock:
-        cache[key] = {
-            'ts': time.time(),
-            'data': payload
-        }
-
-
-def get_ttl_cached_with_age(cache, lock, key, ttl):
-    if not key:
-        return None, None
-    with lock:
-        entry = cache.get(key)
-    if not entry:
-        return None, None
-    age = time.time() - entry['ts']
-    if age > ttl:
-        return None, None
-    return entry['data'], int(age)
-
-
 def append_query_param(url, param):
     if not url or not param:
         return url
@@ -684,14 +1156,53 @@ def append_query_param(url, param):
     return f"{url}{joiner}{param}"
 
 
+ID_REF_RES = {}
+
+
 def extract_id_from_ref(ref, segment):
     if not ref or not segment:
         return None
-    pattern = rf"/{re.escape(segment)}/(\\d+)"
-    match = re.search(pattern, str(ref))
+    pattern = ID_REF_RES.get(segment)
+    if pattern is None:
+        pattern = re.compile(rf"/{re.escape(segment)}/(\d+)")
+        ID_REF_RES[segment] = pattern
+    match = pattern.search(str(ref))
     return match.group(1) if match else None
 
 
+# Separate pool for pagination: fetch_core_items also runs on
+# FETCH_EXECUTOR threads, and nested submits to the same pool could
+# deadlock once it saturates.
+PAGE_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=PLAYER_FETCH_WORKERS, thread_name_prefix='pagefetch')
+
+# Dedicated two-worker pool for racing season candidates in
+# resolve_player_index; index builds block on the fetch pools, so they
+# must not share one.
+INDEX_BUILD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='indexbuild')
+
+HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=HEALTH_CHECK_WORKERS, thread_name_prefix='health')
+
+# Row assembly for /players pages; long-lived so requests stop paying
+# thread spawn/teardown. build_player_row never submits back into a
+# pool, so sizing it like the fetch pools is safe.
+ROW_BUILD_EXECUTOR = ThreadPoolExecutor(max_workers=PLAYER_FETCH_WORKERS, thread_name_prefix='rowbuild')
+
+
+def shutdown_executors():
+    for executor in (
+        FETCH_EXECUTOR,
+        REFRESH_EXECUTOR,
+        PAGE_FETCH_EXECUTOR,
+        INDEX_BUILD_EXECUTOR,
+        HEALTH_EXECUTOR,
+        ROW_BUILD_EXECUTOR
+    ):
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_executors)
+
+
 def fetch_core_items(url):
     if not url:
         return []
@@ -704,18 +1215,21 @@ def fetch_core_items(url):
         page_index = 1
         page_count = 1
     if page_count > page_index:
-        for page in range(page_index + 1, page_count + 1):
-            page_url = append_query_param(url, f"page={page}")
-            page_payload = fetch_json(page_url)
+        futures = [
+            PAGE_FETCH_EXECUTOR.submit(fetch_json, append_query_param(url, f"page={page}"))
+            for page in range(page_index + 1, page_count + 1)
+        ]
+        for future in futures:
+            page_payload = future.result()
             items.extend(page_payload.get('items') or [])
     return items
 
 
 def fetch_core_team_refs(league, season_year):
-    sport = CORE_SPORTS.get(league)
-    if not sport or not season_year:
+    template = CORE_TEAMS_URL_TEMPLATES.get(league)
+    if not template or not season_year:
         return [], None
-    url = f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{season_year}/teams?limit=200"
+    url = template.format(year=season_year)
     items = fetch_core_items(url)
     refs = []
     for item in items:
@@ -729,10 +1243,10 @@ def fetch_core_team_refs(league, season_year):
 
 
 def fetch_team_roster_refs(league, season_year, team_id):
-    sport = CORE_SPORTS.get(league)
-    if not sport or not season_year or not team_id:
+    template = CORE_ROSTER_URL_TEMPLATES.get(league)
+    if not template or not season_year or not team_id:
         return []
-    url = f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{season_year}/teams/{team_id}/athletes?limit=200"
+    url = template.format(year=season_year, team_id=team_id)
     items = fetch_core_items(url)
     refs = []
     for item in items:
@@ -746,29 +1260,21 @@ def fetch_team_roster_refs(league, season_year, team_id):
 
 
 def get_cached_player_leaders(key):
-    if not key:
+    data, age = PLAYER_LEADERS_CACHE.get_with_age(key)
+    if data is None:
         return None
-    entry = PLAYER_LEADERS_CACHE.get(key)
-    if not entry:
-        return None
-    age = time.time() - entry['ts']
-    if age > PLAYER_LEADERS_CACHE_TTL_SEC:
-        return None
-    data = copy.deepcopy(entry['data'])
+    # Copy-on-write: only meta differs per hit, so share the nested
+    # category/table structures and swap in a fresh meta dict.
+    data = dict(data)
     meta = data.get('meta')
     if isinstance(meta, dict):
-        meta['cacheAgeSec'] = int(age)
-        meta['fromCache'] = True
+        data['meta'] = {**meta, 'cacheAgeSec': age, 'fromCache': True}
     return data
 
 
 def set_cached_player_leaders(key, payload):
-    if not key:
-        return
-    PLAYER_LEADERS_CACHE[key] = {
-        'ts': time.time(),
-        'data': copy.deepcopy(payload)
-    }
+    # Callers hand the payload over and never mutate it afterwards.
+    PLAYER_LEADERS_CACHE.set(key, payload)
 
 PLAYER_STATS_SCHEMAS = {
     'mlb': {
@@ -1139,137 +1645,350 @@ PLAYER_TABLE_SCHEMAS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_stat_key(value):
-    return str(value or '').strip().lower()
+    # Identifiers are almost always already strings; skip the str()
+    # round-trip for that case.
+    if type(value) is str:
+        return value.strip().lower()
+    if value is None:
+        return ''
+    return str(value).strip().lower()
 
 
 def build_stat_key_set(values):
     return {normalize_stat_key(value) for value in values if value}
 
 
-def resolve_player_stats_schema(league, mode):
+@lru_cache(maxsize=64)
+def lookup_player_stats_schema(league, mode_key):
     league_schemas = PLAYER_STATS_SCHEMAS.get(league) or {}
-    resolved_mode = 'pitching' if str(mode or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
-    schema = league_schemas.get(resolved_mode)
+    schema = league_schemas.get(mode_key)
     if not schema:
         schema = league_schemas.get(DEFAULT_PLAYER_STATS_MODE) or league_schemas.get('pitching')
     return schema
 
 
+def resolve_player_stats_schema(league, mode):
+    mode_key = 'pitching' if str(mode or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
+    return lookup_player_stats_schema(league, mode_key)
+
+
 def normalize_player_table_view(value):
     if str(value or '').lower() == 'expanded':
         return 'expanded'
     return DEFAULT_PLAYER_TABLE_VIEW
 
 
+def flatten_table_schemas():
+    # (league, mode, view) -> schema, with non-MLB leagues registered
+    # under both modes since mode only matters for MLB.
+    flat = {}
+    for league, league_schema in PLAYER_TABLE_SCHEMAS.items():
+        if league == 'mlb':
+            for mode_key, mode_schema in league_schema.items():
+                for view_key, schema in mode_schema.items():
+                    flat[(league, mode_key, view_key)] = schema
+        else:
+            for view_key, schema in league_schema.items():
+                for mode_key in (DEFAULT_PLAYER_STATS_MODE, 'pitching'):
+                    flat[(league, mode_key, view_key)] = schema
+    return flat
+
+
+FLAT_TABLE_SCHEMAS = flatten_table_schemas()
+
+
+@lru_cache(maxsize=64)
+def lookup_player_table_schema(league, mode_key, view_key):
+    schema = FLAT_TABLE_SCHEMAS.get((league, mode_key, view_key))
+    if schema is not None:
+        return schema
+    return FLAT_TABLE_SCHEMAS.get((league, mode_key, DEFAULT_PLAYER_TABLE_VIEW))
+
+
 def resolve_player_table_schema(league, mode, view):
     view_key = normalize_player_table_view(view)
-    if league == 'mlb':
-        mode_key = 'pitching' if str(mode or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
-        league_schema = PLAYER_TABLE_SCHEMAS.get('mlb') or {}
-        mode_schema = league_schema.get(mode_key) or {}
-        return mode_schema.get(view_key) or mode_schema.get(DEFAULT_PLAYER_TABLE_VIEW)
-    league_schema = PLAYER_TABLE_SCHEMAS.get(league) or {}
-    return league_schema.get(view_key) or league_schema.get(DEFAULT_PLAYER_TABLE_VIEW)
+    mode_key = 'pitching' if str(mode or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
+    return lookup_player_table_schema(league, mode_key, view_key)
+
+
+def get_schema_plan(schema):
+    # Compiled once per schema: (output key, normalized source-key set,
+    # normalized desired-category tuple) per column, plus the schema's
+    # fallback categories.
+    plan = schema.get('_plan')
+    if plan is None:
+        fallback = tuple(
+            normalize_stat_key(name)
+            for name in (schema.get('statCategories') or [])
+            if name
+        )
+        columns = []
+        for column in schema.get('columns') or []:
+            key = column.get('key')
+            if not key:
+                continue
+            # Keys stay in schema order: the first (most specific) key
+            # that resolves wins. Columns without their own category
+            # hints get the schema fallback baked in here, so the row
+            # builder never re-derives it.
+            desired = tuple(
+                normalize_stat_key(name)
+                for name in (column.get('categories') or [])
+                if name
+            )
+            columns.append((
+                key,
+                tuple(
+                    normalize_stat_key(name)
+                    for name in (column.get('keys') or [])
+                    if name
+                ),
+                desired or fallback
+            ))
+        plan = (tuple(columns), fallback)
+        schema['_plan'] = plan
+    return plan
+
+
+def get_column_projection(schema):
+    # The {key, label} column list sent to clients only depends on the
+    # schema; build it once and stash it alongside _plan. Callers treat
+    # it as read-only.
+    projection = schema.get('_columns')
+    if projection is None:
+        projection = [
+            {'key': column.get('key'), 'label': column.get('label')}
+            for column in (schema.get('columns') or [])
+            if column.get('key')
+        ]
+        schema['_columns'] = projection
+    return projection
+
+
+def build_stats_lookup(categories):
+    # One pass over the payload: every stat is normalized once and
+    # indexed under all four identifier fields, both per category and
+    # overall (first occurrence wins, preserving payload order).
+    by_category = {}
+    overall = {}
+    normalize = normalize_stat_key
+    for category in categories:
+        category_map = by_category.setdefault(normalize(category.get('name')), {})
+        for stat in category.get('stats') or []:
+            value = stat.get('displayValue')
+            if value is None:
+                value = stat.get('value')
+            for ident in (
+                stat.get('name'),
+                stat.get('abbreviation'),
+                stat.get('displayName'),
+                stat.get('shortDisplayName')
+            ):
+                norm = normalize(ident)
+                if not norm:
+                    continue
+                category_map.setdefault(norm, value)
+                overall.setdefault(norm, value)
+    return by_category, overall
 
 
-def extract_stat_value_from_categories(categories, column, fallback_categories=None):
-    if not categories:
-        return None
-    keys = build_stat_key_set(column.get('keys') or [])
-    if not keys:
-        return None
+def find_stat_value(lookup, keys, desired):
+    by_category, overall = lookup
+    for category_key in desired:
+        category_map = by_category.get(category_key)
+        if not category_map:
+            continue
+        for key in keys:
+            if key in category_map:
+                return category_map[key]
+    for key in keys:
+        if key in overall:
+            return overall[key]
+    return None
+
 
-    category_map = {
-        normalize_stat_key(category.get('name')): category
-        for category in categories
-        if category.get('name')
+def build_row_stats_from_payload(stats_payload, schema):
+    # The lookup is cached on the payload dict (like schema '_plan'),
+    # so a stats payload served repeatedly from cache is indexed once.
+    columns, _ = get_schema_plan(schema)
+    lookup = None
+    if stats_payload:
+        lookup = stats_payload.get('_stats_lookup')
+        if lookup is None:
+            categories = stats_payload.get('splits', {}).get('categories', [])
+            if categories:
+                lookup = build_stats_lookup(categories)
+                stats_payload['_stats_lookup'] = lookup
+    if not lookup:
+        return {key: None for key, _, _ in columns}
+    return {
+        key: find_stat_value(lookup, keys, desired)
+        for key, keys, desired in columns
     }
 
-    desired = [
-        normalize_stat_key(name)
-        for name in (column.get('categories') or fallback_categories or [])
-        if name
-    ]
 
-    search_categories = []
-    if desired:
-        for name in desired:
-            category = category_map.get(name)
-            if category:
-                search_categories.append(category)
-    if not search_categories:
-        search_categories = categories
-
-    def find_in(categories_list):
-        for category in categories_list:
-            for stat in category.get('stats') or []:
-                name_key = normalize_stat_key(stat.get('name'))
-                abbr_key = normalize_stat_key(stat.get('abbreviation'))
-                display_key = normalize_stat_key(stat.get('displayName'))
-                short_key = normalize_stat_key(stat.get('shortDisplayName'))
-                if (
-                    name_key in keys
-                    or abbr_key in keys
-                    or display_key in keys
-                    or short_key in keys
-                ):
-                    value = stat.get('displayValue')
-                    if value is not None:
-                        return value
-                    return stat.get('value')
-        return None
+def build_row_stats(categories, schema):
+    columns, _ = get_schema_plan(schema)
+    if not categories:
+        return {key: None for key, _, _ in columns}
+    lookup = build_stats_lookup(categories)
+    return {
+        key: find_stat_value(lookup, keys, desired)
+        for key, keys, desired in columns
+    }
+
+
+def compile_schemas(schemas):
+    # Eagerly compile every leaf schema at import so no request pays the
+    # first-use plan build. The literal lists are frozen into tuples in
+    # the same traversal; they are read-only from here on.
+    for value in schemas.values():
+        if not isinstance(value, dict):
+            continue
+        if 'columns' in value:
+            for column in value['columns']:
+                if 'keys' in column:
+                    column['keys'] = tuple(column['keys'])
+                if 'categories' in column:
+                    column['categories'] = tuple(column['categories'])
+            value['columns'] = tuple(value['columns'])
+            if 'statCategories' in value:
+                value['statCategories'] = tuple(value['statCategories'])
+            get_schema_plan(value)
+        else:
+            compile_schemas(value)
 
-    value = find_in(search_categories)
-    if value is not None:
-        return value
-    if search_categories is not categories:
-        return find_in(categories)
-    return None
+
+compile_schemas(PLAYER_STATS_SCHEMAS)
+compile_schemas(PLAYER_TABLE_SCHEMAS)
 
 
 def get_player_profile(ref):
     ref = normalize_core_ref(ref)
-    cached = get_ttl_cached(PLAYER_PROFILE_CACHE, PLAYER_PROFILE_LOCK, ref, PLAYER_PROFILE_CACHE_TTL_SEC)
-    if cached:
-        return cached
+    cached = PLAYER_PROFILE_CACHE.get(ref)
+    if cached is not None:
+        return None if cached is NEGATIVE_SENTINEL else cached
     if not ref:
         return None
+    inflight_key = ('profile', ref)
+    while True:
+        event = acquire_inflight(inflight_key)
+        if event is None:
+            break
+        event.wait(REQUEST_TIMEOUT_SEC)
+        cached = PLAYER_PROFILE_CACHE.get(ref)
+        if cached is not None:
+            return None if cached is NEGATIVE_SENTINEL else cached
     try:
-        payload = fetch_json(ref)
-    except Exception:
-        return None
-    pos_data = payload.get('position') or {}
-    position = pos_data.get('abbreviation') or pos_data.get('shortName') or pos_data.get('name')
-    headshot = payload.get('headshot')
-    if isinstance(headshot, dict):
-        headshot = headshot.get('href')
-    profile = {
-        'id': payload.get('id'),
-        'displayName': payload.get('displayName') or payload.get('fullName'),
-        'shortName': payload.get('shortName') or payload.get('displayName'),
-        'headshot': headshot,
-        'position': position,
-        'teamRef': normalize_core_ref((payload.get('team') or {}).get('$ref')),
-        'statsRef': normalize_core_ref((payload.get('statistics') or {}).get('$ref'))
-    }
-    set_ttl_cached(PLAYER_PROFILE_CACHE, PLAYER_PROFILE_LOCK, ref, profile)
-    return profile
+        try:
+            payload = fetch_json(ref)
+        except Exception:
+            PLAYER_PROFILE_CACHE.set(ref, NEGATIVE_SENTINEL, ttl=PLAYER_NEGATIVE_TTL_SEC)
+            return None
+        pos_data = payload.get('position') or {}
+        position = pos_data.get('abbreviation') or pos_data.get('shortName') or pos_data.get('name')
+        headshot = payload.get('headshot')
+        if isinstance(headshot, dict):
+            headshot = headshot.get('href')
+        profile = {
+            'id': payload.get('id'),
+            'displayName': payload.get('displayName') or payload.get('fullName'),
+            'shortName': payload.get('shortName') or payload.get('displayName'),
+            'headshot': headshot,
+            'position': position,
+            'teamRef': normalize_core_ref((payload.get('team') or {}).get('$ref')),
+            'statsRef': normalize_core_ref((payload.get('statistics') or {}).get('$ref'))
+        }
+        PLAYER_PROFILE_CACHE.set(ref, profile)
+        return profile
+    finally:
+        release_inflight(inflight_key)
 
 
 def get_player_stats_payload(ref):
     ref = normalize_core_ref(ref)
-    cached = get_ttl_cached(PLAYER_STATS_CACHE, PLAYER_STATS_LOCK, ref, PLAYER_STATS_CACHE_TTL_SEC)
-    if cached:
-        return cached
+    cached = PLAYER_STATS_CACHE.get(ref)
+    if cached is not None:
+        return None if cached is NEGATIVE_SENTINEL else cached
     if not ref:
         return None
+    inflight_key = ('stats', ref)
+    while True:
+        event = acquire_inflight(inflight_key)
+        if event is None:
+            break
+        event.wait(REQUEST_TIMEOUT_SEC)
+        cached = PLAYER_STATS_CACHE.get(ref)
+        if cached is not None:
+            return None if cached is NEGATIVE_SENTINEL else cached
     try:
-        payload = fetch_json(ref)
-    except Exception:
-        return None
-    set_ttl_cached(PLAYER_STATS_CACHE, PLAYER_STATS_LOCK, ref, payload)
-    return payload
+        try:
+            payload = fetch_json(ref)
+        except Exception:
+            PLAYER_STATS_CACHE.set(ref, NEGATIVE_SENTINEL, ttl=PLAYER_NEGATIVE_TTL_SEC)
+            return None
+        PLAYER_STATS_CACHE.set(ref, payload)
+        return payload
+    finally:
+        release_inflight(inflight_key)
+
+
+def bulk_get_player_profiles(refs):
+    futures = {}
+    profiles = {}
+    for ref in refs:
+        ref = normalize_core_ref(ref)
+        if not ref or ref in futures:
+            continue
+        cached = PLAYER_PROFILE_CACHE.get(ref)
+        if cached is not None:
+            profiles[ref] = None if cached is NEGATIVE_SENTINEL else cached
+        else:
+            futures[ref] = FETCH_EXECUTOR.submit(get_player_profile, ref)
+    for ref, future in futures.items():
+        profiles[ref] = future.result()
+    return profiles
+
+
+def bulk_get_player_stats(refs):
+    futures = {}
+    payloads = {}
+    for ref in refs:
+        ref = normalize_core_ref(ref)
+        if not ref or ref in futures:
+            continue
+        cached = PLAYER_STATS_CACHE.get(ref)
+        if cached is not None:
+            payloads[ref] = None if cached is NEGATIVE_SENTINEL else cached
+        else:
+            futures[ref] = FETCH_EXECUTOR.submit(get_player_stats_payload, ref)
+    for ref, future in futures.items():
+        payloads[ref] = future.result()
+    return payloads
+
+
+class AthleteEntry:
+    # Dict-shaped accessors over __slots__: thousands of these sit in
+    # the player index cache per league, so the per-entry dict overhead
+    # is worth avoiding.
+    __slots__ = ('id', 'ref', 'position', '_sort')
+
+    def __init__(self, athlete_id, ref, sort_key):
+        self.id = athlete_id
+        self.ref = ref
+        self.position = None
+        self._sort = sort_key
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
 
 
 def build_player_index(league, season_year):
@@ -1279,8 +1998,7 @@ def build_player_index(league, season_year):
         for ref in team_refs
         if extract_id_from_ref(ref, 'teams')
     ]
-    athletes = []
-    seen = set()
+    athletes_by_key = {}
 
     def fetch_roster(team_id):
         try:
@@ -1290,32 +2008,29 @@ def build_player_index(league, season_year):
             return []
 
     if team_ids:
-        max_workers = max(1, min(PLAYER_FETCH_WORKERS, len(team_ids)))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(fetch_roster, team_id) for team_id in team_ids]
-            for future in as_completed(futures):
-                refs = future.result() or []
-                for ref in refs:
-                    ref = normalize_core_ref(ref)
-                    if not ref:
-                        continue
-                    athlete_id = extract_id_from_ref(ref, 'athletes')
-                    dedupe_key = athlete_id or ref
-                    if dedupe_key in seen:
-                        continue
-                    seen.add(dedupe_key)
-                    athletes.append({
-                        'id': athlete_id,
-                        'ref': ref,
-                        'position': None
-                    })
-
-    def sort_key(entry):
-        if entry.get('id') and str(entry['id']).isdigit():
-            return int(entry['id'])
-        return entry.get('ref') or ''
-
-    athletes.sort(key=sort_key)
+        normalize_ref = normalize_core_ref
+        extract_id = extract_id_from_ref
+        futures = [FETCH_EXECUTOR.submit(fetch_roster, team_id) for team_id in team_ids]
+        for future in as_completed(futures):
+            refs = future.result() or []
+            for ref in refs:
+                ref = normalize_ref(ref)
+                if not ref:
+                    continue
+                athlete_id = extract_id(ref, 'athletes')
+                dedupe_key = f"a:{athlete_id}" if athlete_id else f"r:{ref}"
+                if dedupe_key in athletes_by_key:
+                    continue
+                # Composite key: numeric ids in order first, then
+                # non-numeric entries by ref so pagination is stable
+                # across rebuilds despite as_completed arrival order.
+                athletes_by_key[dedupe_key] = AthleteEntry(
+                    athlete_id,
+                    ref,
+                    (0, int(athlete_id), '') if athlete_id and athlete_id.isdigit() else (1, 0, ref)
+                )
+
+    athletes = sorted(athletes_by_key.values(), key=operator.attrgetter('_sort'))
     return {
         'season': season_year,
         'athletes': athletes,
@@ -1329,65 +2044,97 @@ def build_player_index(league, season_year):
 def resolve_player_index(league, season_value):
     season_key = str(season_value or 'current').strip() or 'current'
     cache_key = f"{league}:{season_key}"
-    cached, age = get_ttl_cached_with_age(PLAYER_INDEX_CACHE, PLAYER_INDEX_LOCK, cache_key, PLAYER_INDEX_CACHE_TTL_SEC)
+    cached, age = PLAYER_INDEX_CACHE.get_with_age(cache_key)
     if cached:
         return cached, age, True
 
-    candidates = resolve_core_season_candidates(league, season_key)
-    if not candidates:
-        return None, None, False
+    # Singleflight: concurrent misses for the same index wait for one
+    # build instead of each crawling every roster.
+    inflight_key = ('index', cache_key)
+    while True:
+        event = acquire_inflight(inflight_key)
+        if event is None:
+            break
+        event.wait(REQUEST_TIMEOUT_SEC * 2)
+        cached, age = PLAYER_INDEX_CACHE.get_with_age(cache_key)
+        if cached:
+            return cached, age, True
 
-    last_error = None
-    for candidate in candidates:
+    try:
+        candidates = resolve_core_season_candidates(league, season_key)
+        if not candidates:
+            return None, None, False
+
+        # Build the top two candidates concurrently so a stale first
+        # season does not serialize the fallback behind it. Preference
+        # order is preserved: results are inspected in candidate order.
+        futures = []
+        if len(candidates) > 1:
+            futures = [
+                INDEX_BUILD_EXECUTOR.submit(build_player_index, league, candidate)
+                for candidate in candidates[:2]
+            ]
+
+        last_error = None
         try:
-            index_data = build_player_index(league, candidate)
-            if index_data and index_data.get('athletes'):
-                set_ttl_cached(PLAYER_INDEX_CACHE, PLAYER_INDEX_LOCK, cache_key, index_data)
-                return index_data, 0, False
-        except HTTPError as exc:
-            last_error = exc
-            if exc.code == 404 and season_key == 'current':
-                continue
-            raise
-        except Exception as exc:
-            last_error = exc
-            logging.error('Failed to build player index: %s', exc)
-            continue
+            for position, candidate in enumerate(candidates):
+                try:
+                    if position < len(futures):
+                        index_data = futures[position].result()
+                    else:
+                        index_data = build_player_index(league, candidate)
+                    if index_data and index_data.get('athletes'):
+                        PLAYER_INDEX_CACHE.set(cache_key, index_data)
+                        return index_data, 0, False
+                except HTTPError as exc:
+                    last_error = exc
+                    if exc.code == 404 and season_key == 'current':
+                        continue
+                    raise
+                except Exception as exc:
+                    last_error = exc
+                    logging.error('Failed to build player index: %s', exc)
+                    continue
+        finally:
+            for future in futures:
+                future.cancel()
 
-    if last_error:
-        raise last_error
-    return None, None, False
+        if last_error:
+            raise last_error
+        return None, None, False
+    finally:
+        release_inflight(inflight_key)
 
 
-def build_position_index(index_data, league):
-    if not index_data:
-        return {}
-    position_index = index_data.get('positionIndex') or {}
-    if position_index:
-        return position_index
-    athletes = index_data.get('athletes') or []
-    if not athletes:
-        return position_index
-
-    def resolve_position(entry):
-        if entry.get('position'):
-            return entry
-        profile = get_player_profile(entry.get('ref'))
-        if profile:
-            entry['position'] = profile.get('position')
-        return entry
-
-    max_workers = max(1, min(PLAYER_FETCH_WORKERS, len(athletes)))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for entry in executor.map(resolve_position, athletes):
-            position = entry.get('position')
-            if not position:
-                continue
-            position_key = str(position).upper()
-            position_index.setdefault(position_key, []).append(entry)
+POSITION_SCAN_BATCH = PLAYER_FETCH_WORKERS * 4
+POSITION_SCAN_LOCK = threading.Lock()
 
-    index_data['positionIndex'] = position_index
-    return position_index
+
+def advance_position_scan(index_data, position_key, needed_count):
+    # Resolve athlete positions in batches, bucketing every entry as it
+    # is classified, until the requested bucket holds needed_count
+    # entries or the roster is exhausted. Progress is kept on the index
+    # so later pages and other position filters resume instead of
+    # rescanning; a full-roster resolve only happens if someone walks
+    # to the last page.
+    athletes = index_data.get('athletes') or []
+    with POSITION_SCAN_LOCK:
+        scan = index_data.setdefault('_positionScan', {'offset': 0})
+        buckets = index_data.setdefault('positionIndex', {})
+        while scan['offset'] < len(athletes) and len(buckets.get(position_key) or []) < needed_count:
+            batch = athletes[scan['offset']:scan['offset'] + POSITION_SCAN_BATCH]
+            scan['offset'] += len(batch)
+            unresolved = [entry for entry in batch if not entry.get('position')]
+            profiles = bulk_get_player_profiles(entry.get('ref') for entry in unresolved)
+            for entry in batch:
+                if not entry.get('position'):
+                    profile = profiles.get(entry.get('ref'))
+                    if profile:
+                        entry['position'] = profile.get('position')
+                position = entry.get('position')
+                if position:
+                    buckets.setdefault(str(position).upper(), []).append(entry)
+    return buckets
 
 
 def select_player_entries(index_data, league, position_filter, page, per_page):
@@ -1399,18 +2146,16 @@ def select_player_entries(index_data, league, position_filter, page, per_page):
         return athletes[start:end], total
 
     position_key = str(position_filter).strip().upper()
-    position_index = index_data.get('positionIndex') or {}
-    if position_key not in position_index:
-        position_index = build_position_index(index_data, league)
-    filtered = position_index.get(position_key, [])
-    total = len(filtered)
     start = max(0, (page - 1) * per_page)
-    end = start + per_page
-    return filtered[start:end], total
+    # One entry past the page tells the pager another page exists; the
+    # reported total grows as deeper pages extend the scan.
+    buckets = advance_position_scan(index_data, position_key, start + per_page + 1)
+    filtered = buckets.get(position_key, [])
+    total = len(filtered)
+    return filtered[start:start + per_page], total
 
 
-def build_player_row(args):
-    rank, entry, schema, team_cache = args
+def build_player_row(schema, team_cache, rank, entry):
     profile = get_player_profile(entry.get('ref'))
     if not profile:
         return None
@@ -1423,18 +2168,8 @@ def build_player_row(args):
     stats_payload = None
     if profile.get('statsRef'):
         stats_payload = get_player_stats_payload(profile.get('statsRef'))
-    categories = stats_payload.get('splits', {}).get('categories', []) if stats_payload else []
 
-    row_stats = {}
-    for column in schema.get('columns') or []:
-        key = column.get('key')
-        if not key:
-            continue
-        row_stats[key] = extract_stat_value_from_categories(
-            categories,
-            column,
-            schema.get('statCategories')
-        )
+    row_stats = build_row_stats_from_payload(stats_payload, schema)
 
     return {
         'rank': rank,
@@ -1456,8 +2191,8 @@ def build_player_row(args):
 
 
 def fetch_player_leaders(league, season_value=None, season_type='2', limit=5, mode=DEFAULT_PLAYER_STATS_MODE):
-    sport = CORE_SPORTS.get(league)
-    if not sport:
+    template = CORE_LEADERS_URL_TEMPLATES.get(league)
+    if not template:
         raise ValueError('Unsupported league for player leaders')
     safe_type = str(season_type or '2')
     candidates = resolve_core_season_candidates(league, season_value)
@@ -1470,7 +2205,7 @@ def fetch_player_leaders(league, season_value=None, season_type='2', limit=5, mo
     last_error = None
     for candidate in candidates:
         season_year = candidate
-        url = f"{CORE_API_BASE}/{sport}/leagues/{league}/seasons/{season_year}/types/{safe_type}/leaders"
+        url = template.format(year=season_year, season_type=safe_type)
         try:
             payload = fetch_json(url)
             break
@@ -1486,43 +2221,61 @@ def fetch_player_leaders(league, season_value=None, season_type='2', limit=5, mo
         return None, None
 
     schema = resolve_player_stats_schema(league, mode)
+    # One walk over the categories builds the slim response list and a
+    # by-name index for the primary-category lookup.
+    categories = []
+    categories_by_key = {}
+    for category in payload.get('categories') or []:
+        categories.append({
+            'name': category.get('name'),
+            'displayName': category.get('displayName') or category.get('shortDisplayName'),
+            'abbreviation': category.get('abbreviation'),
+            'leaders': []
+        })
+        categories_by_key.setdefault(normalize_stat_key(category.get('name')), category)
+
     primary_category = None
     if schema:
         category_key = normalize_stat_key(schema.get('leaderCategory'))
         if category_key:
-            for category in payload.get('categories') or []:
-                if normalize_stat_key(category.get('name')) == category_key:
-                    primary_category = category
-                    break
+            primary_category = categories_by_key.get(category_key)
     if not primary_category:
-        primary_category = (payload.get('categories') or [None])[0]
+        primary_category = next(iter(categories_by_key.values()), None)
 
     athlete_cache = {}
     team_cache = {}
     stats_cache = {}
-    categories = [
-        {
-            'name': category.get('name'),
-            'displayName': category.get('displayName') or category.get('shortDisplayName'),
-            'abbreviation': category.get('abbreviation'),
-            'leaders': []
-        }
-        for category in payload.get('categories') or []
-    ]
 
     table = None
     if schema and primary_category:
-        columns = schema.get('columns') or []
-        table_columns = [
-            {
-                'key': column.get('key'),
-                'label': column.get('label')
-            }
-            for column in columns
-            if column.get('key')
-        ]
+        table_columns = get_column_projection(schema)
         rows = []
-        for index, entry in enumerate((primary_category.get('leaders') or [])[:limit], start=1):
+        leaders = (primary_category.get('leaders') or [])[:limit]
+        # Prefetch every athlete/team/stats ref for the visible leaders
+        # in one fan-out so the assembly loop below runs on warm caches
+        # instead of up to three serial fetches per leader.
+        prefetch = {}
+        for entry in leaders:
+            for field, cache in (
+                ('athlete', athlete_cache),
+                ('team', team_cache),
+                ('statistics', stats_cache)
+            ):
+                value = entry.get(field)
+                ref = value.get('$ref') if isinstance(value, dict) else None
+                target = normalize_core_ref(ref)
+                if target and target not in cache:
+                    warm = CORE_REF_CACHE.get(target)
+                    if warm is not None:
+                        cache[target] = warm
+                    else:
+                        prefetch.setdefault(target, cache)
+        if prefetch:
+            for target, ref_payload in fetch_many(prefetch).items():
+                if ref_payload is not None:
+                    CORE_REF_CACHE.set(target, ref_payload)
+                    prefetch[target][target] = ref_payload
+        for index, entry in enumerate(leaders, start=1):
             athlete_ref = entry.get('athlete', {}).get('$ref') if isinstance(entry.get('athlete'), dict) else None
             team_ref = entry.get('team', {}).get('$ref') if isinstance(entry.get('team'), dict) else None
             athlete_data = resolve_core_payload(athlete_ref, athlete_cache) if athlete_ref else None
@@ -1538,15 +2291,8 @@ def fetch_player_leaders(league, season_value=None, season_type='2', limit=5, mo
 
             stats_ref = entry.get('statistics', {}).get('$ref') if isinstance(entry.get('statistics'), dict) else None
             stats_payload = resolve_core_payload(stats_ref, stats_cache) if stats_ref else None
-            stat_categories = stats_payload.get('splits', {}).get('categories', []) if stats_payload else []
 
-            row_stats = {}
-            for column in columns:
-                key = column.get('key')
-                if not key:
-                    continue
-                value = extract_stat_value_from_categories(stat_categories, column, schema.get('statCategories'))
-                row_stats[key] = value
+            row_stats = build_row_stats_from_payload(stats_payload, schema)
 
             rows.append({
                 'rank': index,
@@ -1593,37 +2339,55 @@ def fetch_player_leaders(league, season_value=None, season_type='2', limit=5, mo
 
 
 def get_cached_stats(key):
-    if not key:
-        return None
-    entry = STATS_CACHE.get(key)
-    if not entry:
-        return None
-    if time.time() - entry['ts'] > STATS_CACHE_TTL_SEC:
-        return None
-    return copy.deepcopy(entry['data'])
+    # The cache holds serialized bytes; the only caller sends them
+    # straight back to the client, so a hit skips both the old deepcopy
+    # and the re-encode in the response path.
+    return STATS_CACHE.get(key)
 
 
 def set_cached_stats(key, payload):
-    if not key:
-        return
-    STATS_CACHE[key] = {
-        'ts': time.time(),
-        'data': copy.deepcopy(payload)
-    }
+    # Returns the serialized blob so the caller can send the same bytes
+    # it just cached.
+    blob = json_dump_bytes(payload)
+    STATS_CACHE.set(key, blob)
+    return blob
 
 
 def fetch_matches(endpoint):
     last_error = None
-    for base in API_BASES:
-        url = f"{base.rstrip('/')}/{endpoint.lstrip('/')}"
-        try:
-            data = fetch_json(url)
+    if len(API_BASES) > 1:
+        # Issue every base concurrently but consume results in
+        # configuration order, so the primary still wins when healthy
+        # and a dead base costs one shared timeout instead of a full
+        # one per base. The submitted calls are leaf fetch_json calls,
+        # so riding the page-fetch pool cannot deadlock.
+        futures = [
+            (base, PAGE_FETCH_EXECUTOR.submit(
+                fetch_json, f"{base.rstrip('/')}/{endpoint.lstrip('/')}"
+            ))
+            for base in API_BASES
+        ]
+        for base, future in futures:
+            try:
+                data = future.result()
+            except Exception as exc:
+                last_error = exc
+                logging.warning('Failed to fetch %s from %s: %s', endpoint, base, exc)
+                continue
             if isinstance(data, list):
                 return data, base
             return [], base
-        except Exception as exc:
-            last_error = exc
-            logging.warning('Failed to fetch %s from %s: %s', endpoint, base, exc)
+    else:
+        for base in API_BASES:
+            url = f"{base.rstrip('/')}/{endpoint.lstrip('/')}"
+            try:
+                data = fetch_json(url)
+                if isinstance(data, list):
+                    return data, base
+                return [], base
+            except Exception as exc:
+                last_error = exc
+                logging.warning('Failed to fetch %s from %s: %s', endpoint, base, exc)
     if last_error:
         raise last_error
     raise RuntimeError('Failed to fetch matches')
@@ -1637,68 +2401,87 @@ def to_int(value):
 
 
 def select_logo(logos):
+    # Single explicit pass: called for every team in every game and
+    # standings row, so skip the per-logo key tuples max() would build.
     if not logos:
         return None
-    best = max(
-        logos,
-        key=lambda logo: (
-            to_int(logo.get('width')),
-            to_int(logo.get('height'))
-        )
-    )
+    best = None
+    best_w = best_h = -1
+    for logo in logos:
+        width = to_int(logo.get('width'))
+        height = to_int(logo.get('height'))
+        if width > best_w or (width == best_w and height > best_h):
+            best_w = width
+            best_h = height
+            best = logo
     return best.get('href') or logos[0].get('href')
 
 
+CATEGORY_RE = re.compile(r'[^a-z0-9]+')
+CATEGORY_CLEAN_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*\Z')
+
+
+@lru_cache(maxsize=512)
 def normalize_category(value):
     if not value:
         return ''
-    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-')
+    lowered = value.lower()
+    # Feed categories are usually already in slug form; skip the
+    # substitution pass for those.
+    if CATEGORY_CLEAN_RE.match(lowered):
+        return lowered
+    return CATEGORY_RE.sub('-', lowered).strip('-')
 
 
 def build_streamed_logo(badge):
-    if not badge:
+    if not badge or not isinstance(badge, str):
         return None
-    if isinstance(badge, str):
-        cleaned = badge.strip()
-        if not cleaned:
-            return None
-        if cleaned.startswith('http://') or cleaned.startswith('https://'):
-            return cleaned
-        if cleaned.startswith('/'):
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}{cleaned}"
-        if cleaned.startswith('api/images/') or cleaned.startswith('images/'):
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}/{cleaned}"
-        extension = os.path.splitext(cleaned)[1].lower()
-        if extension in ('.webp', '.png', '.jpg', '.jpeg', '.svg'):
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}/api/images/badge/{cleaned}"
-        return f"{STREAMED_IMAGE_BASE.rstrip('/')}/api/images/badge/{cleaned}.webp"
-    return None
+    return lookup_streamed_logo(badge)
+
+
+@lru_cache(maxsize=512)
+def lookup_streamed_logo(badge):
+    cleaned = badge.strip()
+    if not cleaned:
+        return None
+    if cleaned.startswith('http://') or cleaned.startswith('https://'):
+        return cleaned
+    if cleaned.startswith('/'):
+        return f"{STREAMED_IMAGE_ROOT}{cleaned}"
+    if cleaned.startswith('api/images/') or cleaned.startswith('images/'):
+        return f"{STREAMED_IMAGE_ROOT}/{cleaned}"
+    if cleaned.lower().endswith(STREAMED_IMAGE_EXTS):
+        return f"{STREAMED_IMAGE_ROOT}/api/images/badge/{cleaned}"
+    return f"{STREAMED_IMAGE_ROOT}/api/images/badge/{cleaned}.webp"
 
 
 def build_streamed_poster(poster):
-    if not poster:
+    if not poster or not isinstance(poster, str):
         return None
-    if isinstance(poster, str):
-        cleaned = poster.strip()
-        if not cleaned:
-            return None
-        if cleaned.startswith('http://') or cleaned.startswith('https://'):
-            return cleaned
-        if cleaned.startswith('/'):
-            path = cleaned
-            if not os.path.splitext(path)[1]:
-                path = f"{path}.webp"
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}{path}"
-        if cleaned.startswith('api/images/') or cleaned.startswith('images/'):
-            path = f"/{cleaned.lstrip('/')}"
-            if not os.path.splitext(path)[1]:
-                path = f"{path}.webp"
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}{path}"
-        extension = os.path.splitext(cleaned)[1].lower()
-        if extension in ('.webp', '.png', '.jpg', '.jpeg', '.svg'):
-            return f"{STREAMED_IMAGE_BASE.rstrip('/')}/api/images/proxy/{cleaned}"
-        return f"{STREAMED_IMAGE_BASE.rstrip('/')}/api/images/proxy/{cleaned}.webp"
-    return None
+    return lookup_streamed_poster(poster)
+
+
+@lru_cache(maxsize=512)
+def lookup_streamed_poster(poster):
+    cleaned = poster.strip()
+    if not cleaned:
+        return None
+    if cleaned.startswith('http://') or cleaned.startswith('https://'):
+        return cleaned
+    if cleaned.startswith('/'):
+        path = cleaned
+        if not os.path.splitext(path)[1]:
+            path = f"{path}.webp"
+        return f"{STREAMED_IMAGE_ROOT}{path}"
+    if cleaned.startswith('api/images/') or cleaned.startswith('images/'):
+        path = f"/{cleaned.lstrip('/')}"
+        if not os.path.splitext(path)[1]:
+            path = f"{path}.webp"
+        return f"{STREAMED_IMAGE_ROOT}{path}"
+    extension = os.path.splitext(cleaned)[1].lower()
+    if extension in ('.webp', '.png', '.jpg', '.jpeg', '.svg'):
+        return f"{STREAMED_IMAGE_ROOT}/api/images/proxy/{cleaned}"
+    return f"{STREAMED_IMAGE_ROOT}/api/images/proxy/{cleaned}.webp"
 
 
 def build_streamed_team(team_data):
@@ -1744,7 +2527,23 @@ def fetch_espn_teams(league):
     if not url:
         raise ValueError(f"Unsupported league: {league}")
     data = fetch_json(url)
-    return parse_espn_teams(data), url
+    teams = parse_espn_teams(data)
+    # Tag once at materialization so /teams can serve the list as-is.
+    for team in teams:
+        team['league'] = league
+    return teams, url
+
+
+def refresh_teams(league):
+    cache = TEAM_CACHES.get(league)
+    if not cache:
+        return
+    try:
+        teams, source = fetch_espn_teams(league)
+        cache.update(teams, source)
+    except Exception as exc:
+        cache.mark_error(str(exc))
+        logging.error('ESPN teams fetch failed: %s', exc)
 
 
 def get_teams(league, force_refresh=False):
@@ -1752,9 +2551,26 @@ def get_teams(league, force_refresh=False):
     if not cache:
         return {'teams': []}, 0, False, False
     snapshot = cache.snapshot()
+    teams = snapshot.get('teams')
+    if teams and 'league' not in teams[0]:
+        # Cache files written before teams were tagged with their
+        # league; patching in place is idempotent.
+        for team in teams:
+            team['league'] = league
     cache_age = int(time.time()) - int(snapshot.get('last_fetch') or 0)
     cache_valid = cache_age < TEAM_CACHE_TTL_SEC
 
+    if (
+        not force_refresh
+        and not cache_valid
+        and snapshot.get('teams')
+        and cache_age <= TEAM_CACHE_STALE_SEC
+    ):
+        # Stale-while-revalidate: serve the stale copy immediately and
+        # refresh once in the background.
+        start_revalidation(f"teams:{league}", lambda: refresh_teams(league))
+        return snapshot, cache_age, True, True
+
     if force_refresh or not cache_valid:
         try:
             teams, source = fetch_espn_teams(league)
@@ -1772,9 +2588,10 @@ def get_teams(league, force_refresh=False):
     return snapshot, cache_age, True, False
 
 
-def extract_stat(stats, names):
-    for stat in stats:
-        if stat.get('name') in names:
+def extract_stat(stats_by_name, names):
+    for name in names:
+        stat = stats_by_name.get(name)
+        if stat is not None:
             return stat.get('displayValue') if stat.get('displayValue') is not None else stat.get('value')
     return None
 
@@ -1789,7 +2606,11 @@ def parse_espn_standings(payload):
         parsed = []
         for entry in entries or []:
             team = entry.get('team') or {}
-            stats = entry.get('stats') or []
+            # Index the stat list once; first occurrence wins, matching
+            # the old linear scan.
+            stats_by_name = {}
+            for stat in entry.get('stats') or []:
+                stats_by_name.setdefault(stat.get('name'), stat)
             parsed.append({
                 'team': {
                     'id': team.get('id'),
@@ -1798,14 +2619,14 @@ def parse_espn_standings(payload):
                     'logo': select_logo(team.get('logos') or [])
                 },
                 'stats': {
-                    'wins': extract_stat(stats, ['wins']),
-                    'losses': extract_stat(stats, ['losses']),
-                    'ties': extract_stat(stats, ['ties']),
-                    'otLosses': extract_stat(stats, ['otLosses', 'overtimeLosses']),
-                    'winPercent': extract_stat(stats, ['winPercent', 'pointsPercentage']),
-                    'points': extract_stat(stats, ['points']),
-                    'gamesBehind': extract_stat(stats, ['gamesBehind', 'gamesBack']),
-                    'streak': extract_stat(stats, ['streak'])
+                    'wins': extract_stat(stats_by_name, ['wins']),
+                    'losses': extract_stat(stats_by_name, ['losses']),
+                    'ties': extract_stat(stats_by_name, ['ties']),
+                    'otLosses': extract_stat(stats_by_name, ['otLosses', 'overtimeLosses']),
+                    'winPercent': extract_stat(stats_by_name, ['winPercent', 'pointsPercentage']),
+                    'points': extract_stat(stats_by_name, ['points']),
+                    'gamesBehind': extract_stat(stats_by_name, ['gamesBehind', 'gamesBack']),
+                    'streak': extract_stat(stats_by_name, ['streak'])
                 }
             })
         return parsed
@@ -1848,6 +2669,18 @@ def fetch_espn_standings(league, season=None):
     return parse_espn_standings(data), url
 
 
+def refresh_standings(league, season=None):
+    cache = get_standings_cache(league, season)
+    if not cache:
+        return
+    try:
+        standings, source = fetch_espn_standings(league, season=season)
+        cache.update(standings, source)
+    except Exception as exc:
+        cache.mark_error(str(exc))
+        logging.error('ESPN standings fetch failed: %s', exc)
+
+
 def get_standings(league, season=None, force_refresh=False):
     cache = get_standings_cache(league, season)
     if not cache:
@@ -1856,6 +2689,18 @@ def get_standings(league, season=None, force_refresh=False):
     cache_age = int(time.time()) - int(snapshot.get('last_fetch') or 0)
     cache_valid = cache_age < STANDINGS_CACHE_TTL_SEC
 
+    if (
+        not force_refresh
+        and not cache_valid
+        and snapshot.get('standings')
+        and cache_age <= STANDINGS_CACHE_STALE_SEC
+    ):
+        start_revalidation(
+            f"standings:{league}:{season or 'current'}",
+            lambda: refresh_standings(league, season=season)
+        )
+        return snapshot, cache_age, True, True
+
     if force_refresh or not cache_valid:
         try:
             standings, source = fetch_espn_standings(league, season=season)
@@ -1873,28 +2718,33 @@ def get_standings(league, season=None, force_refresh=False):
     return snapshot, cache_age, True, False
 
 
+# Hosts that answered 405 to HEAD; their probes skip straight to the
+# ranged GET instead of paying the rejected round trip every time.
+HEAD_UNSUPPORTED_HOSTS = set()
+
+
 def probe_url(url):
     def attempt(method):
         start = time.time()
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml'
+        }
+        if method == 'GET':
+            headers['Range'] = 'bytes=0-1024'
         try:
-            headers = {
-                'User-Agent': USER_AGENT,
-                'Accept': 'text/html,application/xhtml+xml'
-            }
-            if method == 'GET':
-                headers['Range'] = 'bytes=0-1024'
-            request = Request(url, headers=headers, method=method)
-            with urlopen(request, timeout=REQUEST_TIMEOUT_SEC) as response:
-                latency_ms = int((time.time() - start) * 1000)
-                return response.status, latency_ms, None
-        except HTTPError as exc:
-            latency_ms = int((time.time() - start) * 1000)
-            return exc.code, latency_ms, None
-        except URLError as exc:
-            latency_ms = int((time.time() - start) * 1000)
-            return None, latency_ms, str(exc)
+            status, _, _ = http_get(url, headers, method=method)
+            return status, int((time.time() - start) * 1000), None
+        except Exception as exc:
+            return None, int((time.time() - start) * 1000), str(exc)
+
+    host = urlparse(url).netloc
+    if host in HEAD_UNSUPPORTED_HOSTS:
+        return attempt('GET')
 
     status, latency_ms, error = attempt('HEAD')
+    if status == 405:
+        HEAD_UNSUPPORTED_HOSTS.add(host)
     if status == 405 or status is None:
         status, latency_ms, error = attempt('GET')
 
@@ -1916,7 +2766,7 @@ def build_health_payload(status_code, latency_ms, error):
         'status': map_health_status(status_code, error),
         'httpStatus': status_code,
         'latencyMs': latency_ms,
-        'checkedAt': datetime.now(tz=timezone.utc).isoformat(),
+        'checkedAt': now_iso(),
         'error': error
     }
 
@@ -1929,7 +2779,7 @@ def check_source_health(source, slug, stream_id=1):
             'status': 'unknown',
             'httpStatus': None,
             'latencyMs': None,
-            'checkedAt': datetime.now(tz=timezone.utc).isoformat(),
+            'checkedAt': now_iso(),
             'error': 'invalid_source_or_slug'
         }
 
@@ -1939,10 +2789,28 @@ def check_source_health(source, slug, stream_id=1):
 
 
 def annotate_sources(sources, include_health, checks_budget=None):
-    annotated = []
     if checks_budget is None:
         checks_budget = {'count': MAX_HEALTH_CHECKS}
 
+    if include_health:
+        # Fan the uncached probes out first so a match costs one slow
+        # round trip instead of one per source; the budget counts
+        # distinct probes, as in apply_health_to_games.
+        pending = {}
+        for src in sources:
+            source_name = src.get('source') or ''
+            source_id = src.get('id') or ''
+            key = f"{source_name}:{source_id}:1"
+            if key in pending or HEALTH_CACHE.get(key) is not None:
+                continue
+            if checks_budget['count'] <= 0:
+                continue
+            checks_budget['count'] -= 1
+            pending[key] = HEALTH_EXECUTOR.submit(check_source_health, source_name, source_id, 1)
+        for key, future in pending.items():
+            HEALTH_CACHE.set(key, future.result())
+
+    annotated = []
     for src in sources:
         source_name = src.get('source') or ''
         source_id = src.get('id') or ''
@@ -1952,12 +2820,7 @@ def annotate_sources(sources, include_health, checks_budget=None):
         }
 
         if include_health:
-            key = f"{source_name}:{source_id}:1"
-            cached = HEALTH_CACHE.get(key)
-            if cached is None and checks_budget['count'] > 0:
-                cached = check_source_health(source_name, source_id, 1)
-                HEALTH_CACHE.set(key, cached)
-                checks_budget['count'] -= 1
+            cached = HEALTH_CACHE.get(f"{source_name}:{source_id}:1")
             if cached is None:
                 cached = {
                     'status': 'unknown',
@@ -1979,31 +2842,24 @@ def sort_sources(sources):
         name = safe_source.get('source') or ''
         health = (safe_source.get('health') or {}).get('status')
         health_key = health if isinstance(health, str) else ''
-        health_score = {
-            'up': 0,
-            'unknown': 1,
-            'down': 2
-        }.get(health_key, 1)
-        try:
-            pref_index = SOURCE_PREFERENCE.index(name)
-        except ValueError:
-            pref_index = len(SOURCE_PREFERENCE)
-        return (health_score, pref_index)
+        return (
+            HEALTH_SCORE.get(health_key, 1),
+            SOURCE_RANK.get(name, SOURCE_RANK_DEFAULT)
+        )
 
     return sorted(sources, key=source_rank)
 
 
-def parse_match(match, is_live=False, include_health=False, league='nfl'):
+def parse_match(match, is_live=False, include_health=False, league='nfl', now=None):
     match_id = match.get('id') or ''
     title = match.get('title') or ''
     category = (match.get('category') or '').lower()
-    timestamp = match.get('date') or now_ms()
-    now = now_ms()
-    live_cutoff_ms = LIVE_MAX_AGE_SEC * 1000
-    ended_cutoff_ms = ENDED_GRACE_SEC * 1000
-    is_live_now = bool(is_live) and (now - timestamp) <= live_cutoff_ms
+    if now is None:
+        now = now_ms()
+    timestamp = match.get('date') or now
+    is_live_now = bool(is_live) and (now - timestamp) <= LIVE_CUTOFF_MS
     is_upcoming = not is_live_now and timestamp > now
-    is_ended = not is_live_now and timestamp <= (now - ended_cutoff_ms)
+    is_ended = not is_live_now and timestamp <= (now - ENDED_GRACE_MS)
 
     raw_sources = []
     for source in match.get('sources') or []:
@@ -2022,7 +2878,9 @@ def parse_match(match, is_live=False, include_health=False, league='nfl'):
             'id': match_id
         }]
 
-    annotated = annotate_sources(raw_sources, include_health)
+    # Without health the annotated list is identical to raw_sources;
+    # skip the per-source dict rebuild.
+    annotated = annotate_sources(raw_sources, True) if include_health else raw_sources
     sorted_sources = sort_sources(annotated)
     best_source = sorted_sources[0] if sorted_sources else {'source': 'admin', 'id': match_id}
 
@@ -2060,15 +2918,38 @@ def parse_match(match, is_live=False, include_health=False, league='nfl'):
     }
 
 
+def refresh_matches():
+    try:
+        all_future = FETCH_EXECUTOR.submit(fetch_matches, '/matches/all')
+        live_matches, live_source = fetch_matches('/matches/live')
+        all_matches, all_source = all_future.result()
+        GAME_CACHE.update(live_matches, all_matches, live_source or all_source)
+    except Exception as exc:
+        GAME_CACHE.mark_error(str(exc))
+        logging.error('Upstream fetch failed: %s', exc)
+
+
 def build_match_cache(force_refresh=False):
     snapshot = GAME_CACHE.snapshot()
     cache_age = int(time.time()) - int(snapshot.get('last_fetch') or 0)
     cache_valid = cache_age < CACHE_TTL_SEC
 
+    if (
+        not force_refresh
+        and not cache_valid
+        and snapshot.get('last_fetch')
+        and cache_age <= CACHE_STALE_SEC
+    ):
+        start_revalidation('matches', refresh_matches)
+        return snapshot, cache_age, True, True
+
     if force_refresh or not cache_valid:
         try:
+            # Overlap the two endpoint fetches; live runs on this
+            # thread while all rides the fetch pool.
+            all_future = FETCH_EXECUTOR.submit(fetch_matches, '/matches/all')
             live_matches, live_source = fetch_matches('/matches/live')
-            all_matches, all_source = fetch_matches('/matches/all')
+            all_matches, all_source = all_future.result()
 
             GAME_CACHE.update(live_matches, all_matches, live_source or all_source)
             snapshot = GAME_CACHE.snapshot()
@@ -2085,84 +2966,158 @@ def build_match_cache(force_refresh=False):
     return snapshot, cache_age, True, False
 
 
-def filter_matches_for_league(matches, league):
-    if league in LEAGUE_CONFIGS:
-        return [match for match in matches if is_league_match(match, league)]
-    return []
+@lru_cache(maxsize=256)
+def leagues_for_category(category):
+    # Leagues whose category pattern accepts this string; an empty
+    # category keeps every league in play. Cuts identify_match_league
+    # from running every matcher per match to (usually) one.
+    if not category:
+        return frozenset(LEAGUE_CONFIGS)
+    return frozenset(
+        league for league, matcher in LEAGUE_MATCHERS.items()
+        if not matcher['categories'] or matcher['categories'].search(category)
+    )
 
 
 def identify_match_league(match):
+    candidates = leagues_for_category((match.get('category') or '').lower())
+    if not candidates:
+        return None
     for league_key in PRIORITY_LEAGUES:
-        if is_league_match(match, league_key):
+        if league_key in candidates and is_league_match(match, league_key):
             return league_key
     for league_key in LEAGUE_CONFIGS.keys():
-        if is_league_match(match, league_key):
+        # Priority keys were already tried above.
+        if league_key in PRIORITY_LEAGUE_RANK:
+            continue
+        if league_key in candidates and is_league_match(match, league_key):
             return league_key
     return None
 
 
 def build_games_for_league(snapshot, league):
-    live_matches = filter_matches_for_league(snapshot.get('live', []), league)
-    all_matches = filter_matches_for_league(snapshot.get('all', []), league)
+    # parse_match output depends on wall-clock status flags, so memoized
+    # entries are only reused within the response-cache window. Callers
+    # never mutate builder output (they copy-on-write), so sharing the
+    # list is safe.
+    memo_key = (league, snapshot.get('last_fetch'))
+    entry = GAME_CACHE.derived.get(memo_key)
+    if entry is not None and (time.time() - entry[0]) < GAMES_RESPONSE_TTL_SEC:
+        return entry[1]
+
+    if league not in LEAGUE_CONFIGS:
+        return []
 
-    live_ids = {m.get('id') for m in live_matches if m.get('id')}
+    live_matches = snapshot.get('live', []) or []
+    live_ids = snapshot.get('live_ids')
+    if live_ids is None:
+        live_ids = {mid for mid in (m.get('id') for m in live_matches) if mid}
 
+    # League filter fused into the build pass; no intermediate lists.
+    now = now_ms()
     live_games = [
-        parse_match(m, is_live=True, include_health=False, league=league)
+        parse_match(m, is_live=True, include_health=False, league=league, now=now)
         for m in live_matches
+        if is_league_match(m, league)
     ]
     upcoming_games = [
-        parse_match(m, is_live=False, include_health=False, league=league)
-        for m in all_matches
-        if not m.get('id') or m.get('id') not in live_ids
+        parse_match(m, is_live=False, include_health=False, league=league, now=now)
+        for m in snapshot.get('all', []) or []
+        if (not m.get('id') or m.get('id') not in live_ids) and is_league_match(m, league)
     ]
 
-    live_games.sort(key=lambda g: g.get('timestamp', 0))
-    upcoming_games.sort(key=lambda g: g.get('timestamp', 0))
-
-    return live_games + upcoming_games
+    # No intermediate sort: sort_games orders live-first by timestamp
+    # anyway, and the game-detail path doesn't care about order.
+    games = live_games + upcoming_games
+    GAME_CACHE.derived[memo_key] = (time.time(), games)
+    return games
 
 
 def build_games_for_all(snapshot):
+    memo_key = ('all', snapshot.get('last_fetch'))
+    entry = GAME_CACHE.derived.get(memo_key)
+    if entry is not None and (time.time() - entry[0]) < GAMES_RESPONSE_TTL_SEC:
+        return entry[1]
+
     live_matches = snapshot.get('live', []) or []
     all_matches = snapshot.get('all', []) or []
-    live_ids = {m.get('id') for m in live_matches if m.get('id')}
+    live_ids = snapshot.get('live_ids')
+    if live_ids is None:
+        live_ids = {mid for mid in (m.get('id') for m in live_matches) if mid}
+    # Snapshots loaded from disk predate the index; fall back to the
+    # matcher scan for anything not covered.
+    league_index = snapshot.get('league_index') or {}
 
+    now = now_ms()
     live_games = []
     for match in live_matches:
-        league = identify_match_league(match)
+        match_id = match.get('id')
+        league = league_index[match_id] if match_id in league_index else identify_match_league(match)
         if not league:
             continue
-        live_games.append(parse_match(match, is_live=True, include_health=False, league=league))
+        live_games.append(parse_match(match, is_live=True, include_health=False, league=league, now=now))
 
     upcoming_games = []
     for match in all_matches:
-        if match.get('id') and match.get('id') in live_ids:
+        match_id = match.get('id')
+        if match_id and match_id in live_ids:
             continue
-        league = identify_match_league(match)
+        league = league_index[match_id] if match_id in league_index else identify_match_league(match)
         if not league:
             continue
-        upcoming_games.append(parse_match(match, is_live=False, include_health=False, league=league))
-
-    live_games.sort(key=lambda g: g.get('timestamp', 0))
-    upcoming_games.sort(key=lambda g: g.get('timestamp', 0))
+        upcoming_games.append(parse_match(match, is_live=False, include_health=False, league=league, now=now))
 
-    return live_games + upcoming_games
+    # No intermediate sort: sort_games orders live-first by timestamp
+    # anyway, and the game-detail path doesn't care about order.
+    games = live_games + upcoming_games
+    GAME_CACHE.derived[memo_key] = (time.time(), games)
+    return games
 
 
 def apply_health_to_games(games):
-    budget = {'count': MAX_HEALTH_CHECKS}
+    # Probe every uncached source across the page in one bounded
+    # fan-out so the request waits roughly one round trip instead of
+    # one per source; entries nearing expiry are refreshed off-path.
+    budget = MAX_HEALTH_CHECKS
+    pending = {}
+    for game in games:
+        for source in game.get('sources') or []:
+            name = source.get('source') or ''
+            source_id = source.get('id') or ''
+            key = f"{name}:{source_id}:1"
+            if key in pending:
+                continue
+            cached, age = HEALTH_CACHE.get_with_age(key)
+            if cached is None:
+                if budget <= 0:
+                    continue
+                budget -= 1
+                pending[key] = HEALTH_EXECUTOR.submit(check_source_health, name, source_id, 1)
+            elif age is not None and age >= HEALTH_REFRESH_AGE_SEC:
+                start_revalidation(
+                    f"health:{key}",
+                    lambda name=name, source_id=source_id, key=key:
+                        HEALTH_CACHE.set(key, check_source_health(name, source_id, 1))
+                )
+    for key, future in pending.items():
+        try:
+            HEALTH_CACHE.set(key, future.result())
+        except Exception as exc:
+            logging.warning('Health probe failed for %s: %s', key, exc)
+
     updated = []
     for game in games:
         sources = game.get('sources') or []
-        annotated = annotate_sources(sources, include_health=True, checks_budget=budget)
+        annotated = annotate_sources(sources, include_health=True, checks_budget={'count': 0})
         sorted_sources = sort_sources(annotated)
         best_source = sorted_sources[0] if sorted_sources else {
             'source': game.get('currentSource') or 'admin',
             'id': game.get('slug')
         }
 
-        game_copy = copy.deepcopy(game)
+        # Only these three top-level keys are rewritten; everything
+        # nested is read-only downstream, so a shallow copy suffices.
+        game_copy = {**game}
         game_copy['sources'] = sorted_sources
         game_copy['currentSource'] = best_source.get('source') or game_copy.get('currentSource')
         game_copy['slug'] = best_source.get('id') or game_copy.get('slug')
@@ -2180,47 +3135,124 @@ def filter_games(games, filter_value):
 
 
 def sort_games(games, league):
+    # Decorate-sort-undecorate with plain tuples keeps the whole sort in
+    # C; the enumerate index preserves stability and stops the compare
+    # from ever reaching the game dicts.
     if league == 'all':
-        priority = {key: index for index, key in enumerate(PRIORITY_LEAGUES)}
-        return sorted(
-            games,
-            key=lambda g: (
-                priority.get(g.get('league'), len(priority)),
+        default_rank = len(PRIORITY_LEAGUE_RANK)
+        decorated = [
+            (
+                PRIORITY_LEAGUE_RANK.get(g.get('league'), default_rank),
                 not g.get('isLive'),
-                g.get('timestamp', 0)
+                g.get('timestamp', 0),
+                index,
+                g
             )
-        )
-    return sorted(games, key=lambda g: (not g.get('isLive'), g.get('timestamp', 0)))
+            for index, g in enumerate(games)
+        ]
+    else:
+        decorated = [
+            (not g.get('isLive'), g.get('timestamp', 0), index, g)
+            for index, g in enumerate(games)
+        ]
+    decorated.sort()
+    return [item[-1] for item in decorated]
+
+
+def build_slug_index(games):
+    # Positions instead of game references so the same index resolves
+    # into the health-annotated copy of the list, which preserves order.
+    # setdefault keeps the first-match-wins semantics of the old scan.
+    index = {}
+    for pos, game in enumerate(games):
+        for value in (game.get('slug'), game.get('matchId')):
+            normalized = sanitize_slug(value)
+            if normalized:
+                index.setdefault(normalized, (pos, None))
+        for source in game.get('sources') or []:
+            normalized = sanitize_slug(source.get('id'))
+            if normalized:
+                index.setdefault(normalized, (pos, source))
+    return index
 
 
-def find_game_by_slug(games, slug):
+def get_slug_index(snapshot, league, games):
+    # Slugs and sort order don't depend on wall clock, so unlike the
+    # builder memo this entry lives for the whole snapshot.
+    memo_key = ('slug_index', league, snapshot.get('last_fetch'))
+    index = GAME_CACHE.derived.get(memo_key)
+    if index is None:
+        index = build_slug_index(games)
+        GAME_CACHE.derived[memo_key] = index
+    return index
+
+
+def find_game_by_slug(games, slug, index=None):
     if not slug:
         return None
     normalized = sanitize_slug(slug)
-    for game in games:
-        if normalized in (sanitize_slug(game.get('slug')), sanitize_slug(game.get('matchId'))):
-            return game
-        for source in game.get('sources') or []:
-            if normalized == sanitize_slug(source.get('id')):
-                match = copy.deepcopy(game)
-                match['slug'] = source.get('id')
-                match['currentSource'] = source.get('source')
-                return match
-    return None
+    if index is None:
+        index = build_slug_index(games)
+    hit = index.get(normalized)
+    if hit is None:
+        return None
+    pos, source = hit
+    if pos >= len(games):
+        return None
+    game = games[pos]
+    if source is None:
+        return game
+    # Only top-level keys are rewritten and callers never mutate the
+    # nested structures, so a shallow copy does.
+    return {**game, 'slug': source.get('id'), 'currentSource': source.get('source')}
+
+
+# Every JSON response carries the same five fixed headers; emit them as one
+# preformatted block instead of five send_header calls per request.
+JSON_HEADER_BLOCK = (
+    b'Content-Type: application/json\r\n'
+    b'Cache-Control: no-store\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET,OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: Content-Type\r\n'
+)
 
 
 class RequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive for the dashboards that poll
+    # /games and /health; safe because every response carries a
+    # Content-Length (or is a bodyless 204). TCP_NODELAY avoids Nagle
+    # delaying the small JSON payloads.
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
     def _send_json(self, status_code, payload):
-        body = json.dumps(payload).encode('utf-8')
+        self._send_json_bytes(status_code, json_dump_bytes(payload))
+
+    def _send_json_bytes(self, status_code, body, etag=None):
+        # Level 1 keeps the CPU cost a fraction of what the repetitive
+        # JSON keys save on the wire.
+        encoded = len(body) > GZIP_MIN_BYTES and 'gzip' in (self.headers.get('Accept-Encoding') or '')
+        if encoded:
+            body = gzip.compress(body, compresslevel=1)
         self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', str(len(body)))
-        self.send_header('Cache-Control', 'no-store')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET,OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-        self.wfile.write(body)
+        if encoded:
+            self.send_header('Content-Encoding', 'gzip')
+        if etag:
+            self.send_header('ETag', etag)
+        # Inlined end_headers with the body folded into the same write:
+        # wfile is unbuffered, so this is one send syscall per response
+        # instead of one for headers and one for the body. HTTP/0.9
+        # requests have no header buffer at all, so only touch it on
+        # the 1.x path.
+        if self.request_version != 'HTTP/0.9':
+            self._headers_buffer.append(JSON_HEADER_BLOCK)
+            self._headers_buffer.append(b'\r\n')
+            self.wfile.write(b''.join(self._headers_buffer) + body)
+            self._headers_buffer = []
+        else:
+            self.wfile.write(body)
 
     def do_OPTIONS(self):
         self.send_response(204)
@@ -2229,85 +3261,87 @@ class RequestHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 
-    def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
-        query = parse_qs(parsed.query)
-
-        if path == '/health':
+    def _handle_health(self, query):
+        now = time.time()
+        body = HEALTH_BODY_CACHE['body']
+        if body is None or now - HEALTH_BODY_CACHE['ts'] >= HEALTH_BODY_TTL_SEC:
             snapshot = GAME_CACHE.snapshot()
-            cache_age = int(time.time()) - int(snapshot.get('last_fetch') or 0)
-            payload = {
+            cache_age = int(now) - int(snapshot.get('last_fetch') or 0)
+            body = json_dump_bytes({
                 'status': 'ok',
                 'cacheAgeSec': cache_age,
                 'lastFetch': snapshot.get('last_fetch'),
                 'lastError': snapshot.get('last_error'),
                 'upstreamBase': snapshot.get('last_source')
-            }
-            return self._send_json(200, payload)
+            })
+            HEALTH_BODY_CACHE['body'] = body
+            HEALTH_BODY_CACHE['ts'] = now
+        return self._send_json_bytes(200, body)
 
-        if path == '/teams':
-            league = (query.get('league') or ['nfl'])[0].lower()
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
+    def _handle_teams(self, query):
+        league = query.get('league', 'nfl').lower()
+        force_refresh = query.get('force', '0') in TRUE_VALUES
 
-            if league == 'all':
-                teams = []
-                stale = False
-                cache_age = 0
-                for league_key in LEAGUE_CONFIGS.keys():
-                    snapshot, league_age, cache_ok, league_stale = get_teams(league_key, force_refresh=force_refresh)
-                    if not cache_ok:
-                        continue
-                    league_teams = [
-                        {**team, 'league': league_key}
-                        for team in snapshot.get('teams', [])
-                    ]
-                    teams.extend(league_teams)
-                    stale = stale or league_stale
-                    cache_age = max(cache_age, league_age)
-
-                return self._send_json(200, {
-                    'teams': teams,
-                    'meta': {
-                        'count': len(teams),
-                        'league': 'all',
-                        'cacheAgeSec': cache_age,
-                        'stale': stale
-                    }
-                })
-
-            snapshot, cache_age, cache_ok, stale = get_teams(league, force_refresh=force_refresh)
-            if not cache_ok:
-                return self._send_json(502, {
-                    'error': 'upstream_unavailable',
-                    'message': snapshot.get('last_error'),
-                    'teams': []
-                })
+        if league == 'all':
+            teams = []
+            stale = False
+            cache_age = 0
+            # Cache misses are blocking HTTP calls; fan the leagues out so
+            # the wall clock is the slowest fetch, not the sum.
+            futures = {
+                league_key: FETCH_EXECUTOR.submit(get_teams, league_key, force_refresh=force_refresh)
+                for league_key in LEAGUE_CONFIGS.keys()
+            }
+            for league_key, future in futures.items():
+                snapshot, league_age, cache_ok, league_stale = future.result()
+                if not cache_ok:
+                    continue
+                teams.extend(snapshot.get('teams', []))
+                stale = stale or league_stale
+                cache_age = max(cache_age, league_age)
 
-            payload = {
-                'teams': [
-                    {**team, 'league': league}
-                    for team in snapshot.get('teams', [])
-                ],
+            return self._send_json(200, {
+                'teams': teams,
                 'meta': {
-                    'count': len(snapshot.get('teams', [])),
-                    'league': league,
+                    'count': len(teams),
+                    'league': 'all',
                     'cacheAgeSec': cache_age,
-                    'stale': stale,
-                    'upstreamBase': snapshot.get('last_source')
+                    'stale': stale
                 }
-            }
-            return self._send_json(200, payload)
+            })
 
-        if path == '/stats':
-            league = (query.get('league') or ['nfl'])[0].lower()
-            away_name = (query.get('away') or [''])[0]
-            home_name = (query.get('home') or [''])[0]
-            away_abbr = (query.get('abbrAway') or [''])[0]
-            home_abbr = (query.get('abbrHome') or [''])[0]
-            date_value = format_scoreboard_date((query.get('date') or [''])[0])
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
+        snapshot, cache_age, cache_ok, stale = get_teams(league, force_refresh=force_refresh)
+        if not cache_ok:
+            return self._send_json(502, {
+                'error': 'upstream_unavailable',
+                'message': snapshot.get('last_error'),
+                'teams': []
+            })
 
+        payload = {
+            'teams': snapshot.get('teams', []),
+            'meta': {
+                'count': len(snapshot.get('teams', [])),
+                'league': league,
+                'cacheAgeSec': cache_age,
+                'stale': stale,
+                'upstreamBase': snapshot.get('last_source')
+            }
+        }
+        return self._send_json(200, payload)
+
+    def _handle_stats(self, query):
+        league = query.get('league', 'nfl').lower()
+        away_name = query.get('away', '')
+        home_name = query.get('home', '')
+        away_abbr = query.get('abbrAway', '')
+        home_abbr = query.get('abbrHome', '')
+        date_value = format_scoreboard_date(query.get('date', ''))
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+
+        event_key = (league, away_abbr, home_abbr, away_name, home_name, date_value)
+        event_id = None if force_refresh else EVENT_ID_CACHE.get(event_key)
+        if event_id is None:
             scoreboard = fetch_espn_scoreboard(league, date_value)
             event = find_espn_event(scoreboard, away_abbr, home_abbr, away_name, home_name)
             if not event and date_value:
@@ -2321,307 +3355,320 @@ class RequestHandler(BaseHTTPRequestHandler):
                 })
 
             event_id = event.get('id')
-            cache_key = f"{league}:{event_id}"
-            cached = None if force_refresh else get_cached_stats(cache_key)
-            if cached:
-                return self._send_json(200, cached)
-
-            summary = fetch_espn_summary(league, event_id)
-            if not summary:
-                return self._send_json(502, {
-                    'error': 'summary_unavailable',
-                    'message': 'Unable to fetch ESPN summary.'
-                })
+            EVENT_ID_CACHE.set(event_key, event_id)
+        cache_key = f"{league}:{event_id}"
+        cached = None if force_refresh else get_cached_stats(cache_key)
+        if cached:
+            return self._send_json_bytes(200, cached)
+
+        summary = fetch_espn_summary(league, event_id)
+        if not summary:
+            return self._send_json(502, {
+                'error': 'summary_unavailable',
+                'message': 'Unable to fetch ESPN summary.'
+            })
 
-            win_probability = summary.get('winProbability') or summary.get('winprobability')
-            payload = {
-                'eventId': event_id,
-                'league': league,
-                'header': summary.get('header'),
-                'boxscore': summary.get('boxscore'),
-                'leaders': summary.get('leaders'),
-                'injuries': summary.get('injuries'),
-                'broadcasts': summary.get('broadcasts'),
-                'gameInfo': summary.get('gameInfo'),
-                'notes': summary.get('notes'),
-                'standings': summary.get('standings'),
-                'drives': summary.get('drives'),
-                'plays': summary.get('plays'),
-                'scoringPlays': summary.get('scoringPlays'),
-                'winProbability': win_probability,
-                'probability': summary.get('probability'),
-                'odds': summary.get('odds'),
-                'meta': {
-                    'source': summary.get('meta', {}),
-                    'date': date_value
-                }
+        win_probability = summary.get('winProbability') or summary.get('winprobability')
+        payload = {
+            'eventId': event_id,
+            'league': league,
+            'header': summary.get('header'),
+            'boxscore': summary.get('boxscore'),
+            'leaders': summary.get('leaders'),
+            'injuries': summary.get('injuries'),
+            'broadcasts': summary.get('broadcasts'),
+            'gameInfo': summary.get('gameInfo'),
+            'notes': summary.get('notes'),
+            'standings': summary.get('standings'),
+            'drives': summary.get('drives'),
+            'plays': summary.get('plays'),
+            'scoringPlays': summary.get('scoringPlays'),
+            'winProbability': win_probability,
+            'probability': summary.get('probability'),
+            'odds': summary.get('odds'),
+            'meta': {
+                'source': summary.get('meta', {}),
+                'date': date_value
             }
-            set_cached_stats(cache_key, payload)
-            return self._send_json(200, payload)
-
-        if path == '/players':
-            league = (query.get('league') or ['nfl'])[0].lower()
-            season_value = (query.get('season') or ['current'])[0]
-            view_value = (query.get('view') or ['standard'])[0]
-            mode_value = (query.get('mode') or [DEFAULT_PLAYER_STATS_MODE])[0]
-            position_value = (query.get('position') or ['all'])[0]
-            page_value = (query.get('page') or ['1'])[0]
-            per_page_value = (query.get('perPage') or query.get('per_page') or ['50'])[0]
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
-
-            if league not in CORE_SPORTS:
-                return self._send_json(400, {
-                    'error': 'unsupported_league',
-                    'message': 'Player stats are only available for NFL, NBA, MLB, and NHL.'
-                })
-
-            try:
-                page = max(1, int(page_value))
-            except ValueError:
-                page = 1
+        }
+        return self._send_json_bytes(200, set_cached_stats(cache_key, payload))
+
+    def _handle_players(self, query):
+        league = query.get('league', 'nfl').lower()
+        season_value = query.get('season', 'current')
+        view_value = query.get('view', 'standard')
+        mode_value = query.get('mode', DEFAULT_PLAYER_STATS_MODE)
+        position_value = query.get('position', 'all')
+        page_value = query.get('page', '1')
+        per_page_value = query.get('perPage') or query.get('per_page') or '50'
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+
+        if league not in CORE_SPORTS:
+            return self._send_json(400, {
+                'error': 'unsupported_league',
+                'message': 'Player stats are only available for NFL, NBA, MLB, and NHL.'
+            })
 
-            try:
-                per_page = int(per_page_value)
-            except ValueError:
-                per_page = 50
-            per_page = max(10, min(200, per_page))
-
-            view_key = normalize_player_table_view(view_value)
-            mode_key = 'pitching' if str(mode_value or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
-            schema = resolve_player_table_schema(league, mode_key, view_key)
-            if not schema:
-                return self._send_json(400, {
-                    'error': 'unsupported_view',
-                    'message': 'Player stats are unavailable for the requested view.'
-                })
+        try:
+            page = max(1, int(page_value))
+        except ValueError:
+            page = 1
 
-            season_key = str(season_value or 'current').strip() or 'current'
-            position_value = str(position_value or '').strip() or 'all'
-            cache_key = f"{league}:{season_key}:{view_key}:{mode_key}:{position_value}:{page}:{per_page}"
-            cached, age = (None, None)
-            if not force_refresh:
-                cached, age = get_ttl_cached_with_age(
-                    PLAYER_PAGE_CACHE,
-                    PLAYER_PAGE_LOCK,
-                    cache_key,
-                    PLAYER_PAGE_CACHE_TTL_SEC
-                )
-            if cached:
-                meta = cached.get('meta') or {}
-                meta['cacheAgeSec'] = age or 0
-                meta['fromCache'] = True
-                cached['meta'] = meta
-                return self._send_json(200, cached)
+        try:
+            per_page = int(per_page_value)
+        except ValueError:
+            per_page = 50
+        per_page = max(10, min(200, per_page))
+
+        view_key = normalize_player_table_view(view_value)
+        mode_key = 'pitching' if str(mode_value or '').lower() == 'pitching' else DEFAULT_PLAYER_STATS_MODE
+        schema = resolve_player_table_schema(league, mode_key, view_key)
+        if not schema:
+            return self._send_json(400, {
+                'error': 'unsupported_view',
+                'message': 'Player stats are unavailable for the requested view.'
+            })
 
-            try:
-                index_data, index_age, index_from_cache = resolve_player_index(league, season_key)
-            except HTTPError as exc:
-                logging.error('Player index fetch failed: %s', exc)
-                if exc.code == 404:
-                    return self._send_json(404, {
-                        'error': 'season_not_found',
-                        'message': 'No player stats found for the requested season.'
-                    })
-                return self._send_json(502, {
-                    'error': 'players_unavailable',
-                    'message': str(exc)
-                })
-            except Exception as exc:
-                logging.error('Player index fetch failed: %s', exc)
-                return self._send_json(502, {
-                    'error': 'players_unavailable',
-                    'message': str(exc)
-                })
+        season_key = str(season_value or 'current').strip() or 'current'
+        position_value = str(position_value or '').strip() or 'all'
+        cache_key = f"{league}:{season_key}:{view_key}:{mode_key}:{position_value}:{page}:{per_page}"
+        cached, age = (None, None)
+        if not force_refresh:
+            cached, age = PLAYER_PAGE_CACHE.get_with_age(cache_key)
+        if cached:
+            # The cache holds the page pre-serialized up to (and
+            # including) a trailing '"meta":'; only the small per-hit
+            # meta dict is encoded here, not the row table.
+            page_bytes, meta = cached
+            meta = {**meta, 'cacheAgeSec': age or 0, 'fromCache': True}
+            return self._send_json_bytes(200, page_bytes + json_dump_bytes(meta) + b'}')
 
-            if not index_data or not index_data.get('athletes'):
+        try:
+            index_data, index_age, index_from_cache = resolve_player_index(league, season_key)
+        except HTTPError as exc:
+            logging.error('Player index fetch failed: %s', exc)
+            if exc.code == 404:
                 return self._send_json(404, {
-                    'error': 'players_not_found',
-                    'message': 'No player stats available for this season.'
+                    'error': 'season_not_found',
+                    'message': 'No player stats found for the requested season.'
                 })
+            return self._send_json(502, {
+                'error': 'players_unavailable',
+                'message': str(exc)
+            })
+        except Exception as exc:
+            logging.error('Player index fetch failed: %s', exc)
+            return self._send_json(502, {
+                'error': 'players_unavailable',
+                'message': str(exc)
+            })
+
+        if not index_data or not index_data.get('athletes'):
+            return self._send_json(404, {
+                'error': 'players_not_found',
+                'message': 'No player stats available for this season.'
+            })
 
+        entries, total = select_player_entries(index_data, league, position_value, page, per_page)
+        max_page = max(1, (total + per_page - 1) // per_page)
+        if page > max_page:
+            page = max_page
             entries, total = select_player_entries(index_data, league, position_value, page, per_page)
-            max_page = max(1, (total + per_page - 1) // per_page)
-            if page > max_page:
-                page = max_page
-                entries, total = select_player_entries(index_data, league, position_value, page, per_page)
-
-            start_rank = (page - 1) * per_page + 1
-            team_cache = {}
-            args_list = [
-                (start_rank + offset, entry, schema, team_cache)
-                for offset, entry in enumerate(entries)
-            ]
-            rows = []
-            if args_list:
-                max_workers = max(1, min(PLAYER_FETCH_WORKERS, len(args_list)))
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    for row in executor.map(build_player_row, args_list):
-                        if row:
-                            rows.append(row)
-
-            columns = [
-                {'key': column.get('key'), 'label': column.get('label')}
-                for column in (schema.get('columns') or [])
-                if column.get('key')
-            ]
 
-            payload = {
-                'league': league,
-                'season': index_data.get('season'),
-                'view': view_key,
-                'mode': mode_key if league == 'mlb' else None,
-                'position': position_value,
-                'page': page,
-                'perPage': per_page,
-                'total': total,
-                'table': {
-                    'columns': columns,
-                    'rows': rows
-                },
-                'meta': {
-                    'source': index_data.get('source'),
-                    'cacheAgeSec': index_age or 0,
-                    'fromCache': index_from_cache
-                }
-            }
+        start_rank = (page - 1) * per_page + 1
+        # Warm the profile and stats caches for the whole page in
+        # one fan-out before rows are assembled.
+        profiles = bulk_get_player_profiles(entry.get('ref') for entry in entries)
+        bulk_get_player_stats(
+            profile.get('statsRef')
+            for profile in profiles.values()
+            if profile and profile.get('statsRef')
+        )
+        team_cache = {}
+        rows = []
+        if entries:
+            build_row = partial(build_player_row, schema, team_cache)
+            ranks = range(start_rank, start_rank + len(entries))
+            for row in ROW_BUILD_EXECUTOR.map(build_row, ranks, entries):
+                if row:
+                    rows.append(row)
 
-            set_ttl_cached(PLAYER_PAGE_CACHE, PLAYER_PAGE_LOCK, cache_key, payload)
-            return self._send_json(200, payload)
-
-        if path == '/leaders':
-            league = (query.get('league') or ['nfl'])[0].lower()
-            season_value = (query.get('season') or ['current'])[0]
-            season_type = (query.get('type') or query.get('seasontype') or ['2'])[0]
-            mode_value = (query.get('mode') or ['hitting'])[0]
-            limit_value = (query.get('limit') or ['5'])[0]
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
-
-            if league not in CORE_SPORTS:
-                return self._send_json(400, {
-                    'error': 'unsupported_league',
-                    'message': 'Player leaders are only available for NFL, NBA, MLB, and NHL.'
-                })
+        columns = get_column_projection(schema)
 
-            try:
-                limit = max(1, min(25, int(limit_value)))
-            except ValueError:
-                limit = 5
+        payload = {
+            'league': league,
+            'season': index_data.get('season'),
+            'view': view_key,
+            'mode': mode_key if league == 'mlb' else None,
+            'position': position_value,
+            'page': page,
+            'perPage': per_page,
+            'total': total,
+            'table': {
+                'columns': columns,
+                'rows': rows
+            }
+        }
+        meta = {
+            'source': index_data.get('source'),
+            'cacheAgeSec': index_age or 0,
+            'fromCache': index_from_cache
+        }
 
-            season_key = str(season_value or 'current').strip() or 'current'
-            mode_key = str(mode_value or DEFAULT_PLAYER_STATS_MODE).strip().lower() or DEFAULT_PLAYER_STATS_MODE
-            cache_key = f"{league}:{season_key}:{season_type}:{limit}:{mode_key}"
-            cached = None if force_refresh else get_cached_player_leaders(cache_key)
-            if cached:
-                return self._send_json(200, cached)
+        # Serialize the heavy table once; cache hits re-encode only the
+        # meta dict and splice it onto the stored bytes.
+        page_bytes = json_dump_bytes(payload)[:-1] + b',"meta":'
+        PLAYER_PAGE_CACHE.set(cache_key, (page_bytes, meta))
+        return self._send_json_bytes(200, page_bytes + json_dump_bytes(meta) + b'}')
+
+    def _handle_leaders(self, query):
+        league = query.get('league', 'nfl').lower()
+        season_value = query.get('season', 'current')
+        season_type = query.get('type') or query.get('seasontype') or '2'
+        mode_value = query.get('mode', 'hitting')
+        limit_value = query.get('limit', '5')
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+
+        if league not in CORE_SPORTS:
+            return self._send_json(400, {
+                'error': 'unsupported_league',
+                'message': 'Player leaders are only available for NFL, NBA, MLB, and NHL.'
+            })
 
-            try:
-                payload, _ = fetch_player_leaders(
-                    league,
-                    season_value=season_key,
-                    season_type=season_type,
-                    limit=limit,
-                    mode=mode_key
-                )
-            except HTTPError as exc:
-                logging.error('Player leaders fetch failed: %s', exc)
-                if exc.code == 404:
-                    return self._send_json(404, {
-                        'error': 'season_not_found',
-                        'message': 'No player leaders found for the requested season.'
-                    })
-                return self._send_json(502, {
-                    'error': 'leaders_unavailable',
-                    'message': str(exc)
-                })
-            except Exception as exc:
-                logging.error('Player leaders fetch failed: %s', exc)
-                return self._send_json(502, {
-                    'error': 'leaders_unavailable',
-                    'message': str(exc)
-                })
+        try:
+            limit = max(1, min(25, int(limit_value)))
+        except ValueError:
+            limit = 5
+
+        season_key = str(season_value or 'current').strip() or 'current'
+        mode_key = str(mode_value or DEFAULT_PLAYER_STATS_MODE).strip().lower() or DEFAULT_PLAYER_STATS_MODE
+        cache_key = f"{league}:{season_key}:{season_type}:{limit}:{mode_key}"
+        cached = None if force_refresh else get_cached_player_leaders(cache_key)
+        if cached:
+            return self._send_json(200, cached)
 
-            if not payload:
+        try:
+            payload, _ = fetch_player_leaders(
+                league,
+                season_value=season_key,
+                season_type=season_type,
+                limit=limit,
+                mode=mode_key
+            )
+        except HTTPError as exc:
+            logging.error('Player leaders fetch failed: %s', exc)
+            if exc.code == 404:
                 return self._send_json(404, {
                     'error': 'season_not_found',
                     'message': 'No player leaders found for the requested season.'
                 })
+            return self._send_json(502, {
+                'error': 'leaders_unavailable',
+                'message': str(exc)
+            })
+        except Exception as exc:
+            logging.error('Player leaders fetch failed: %s', exc)
+            return self._send_json(502, {
+                'error': 'leaders_unavailable',
+                'message': str(exc)
+            })
 
-            set_cached_player_leaders(cache_key, payload)
-            return self._send_json(200, payload)
+        if not payload:
+            return self._send_json(404, {
+                'error': 'season_not_found',
+                'message': 'No player leaders found for the requested season.'
+            })
 
-        if path == '/standings':
-            league = (query.get('league') or ['nfl'])[0].lower()
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
-            season_value = (query.get('season') or [''])[0].strip()
-            season = season_value if season_value.isdigit() else None
+        set_cached_player_leaders(cache_key, payload)
+        return self._send_json(200, payload)
 
-            if league == 'all':
-                standings_payload = []
-                stale = False
-                cache_age = 0
-                for league_key in ESPN_STANDINGS_ENDPOINTS.keys():
-                    snapshot, league_age, cache_ok, league_stale = get_standings(
-                        league_key,
-                        season=season,
-                        force_refresh=force_refresh
-                    )
-                    if not cache_ok:
-                        continue
-                    standings = snapshot.get('standings') or {}
-                    if not isinstance(standings, dict):
-                        standings = {}
-                    standings_payload.append({
-                        'league': league_key,
-                        **standings
-                    })
-                    stale = stale or league_stale
-                    cache_age = max(cache_age, league_age)
-
-                return self._send_json(200, {
-                    'standings': standings_payload,
-                    'meta': {
-                        'count': len(standings_payload),
-                        'league': 'all',
-                        'season': season or 'current',
-                        'cacheAgeSec': cache_age,
-                        'stale': stale
-                    }
-                })
+    def _handle_standings(self, query):
+        league = query.get('league', 'nfl').lower()
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+        season_value = query.get('season', '').strip()
+        season = season_value if season_value.isdigit() else None
 
-            snapshot, cache_age, cache_ok, stale = get_standings(league, season=season, force_refresh=force_refresh)
-            if not cache_ok:
-                return self._send_json(502, {
-                    'error': 'upstream_unavailable',
-                    'message': snapshot.get('last_error'),
-                    'standings': []
+        if league == 'all':
+            standings_payload = []
+            stale = False
+            cache_age = 0
+            futures = {
+                league_key: FETCH_EXECUTOR.submit(
+                    get_standings,
+                    league_key,
+                    season=season,
+                    force_refresh=force_refresh
+                )
+                for league_key in ESPN_STANDINGS_ENDPOINTS.keys()
+            }
+            for league_key, future in futures.items():
+                snapshot, league_age, cache_ok, league_stale = future.result()
+                if not cache_ok:
+                    continue
+                standings = snapshot.get('standings') or {}
+                if not isinstance(standings, dict):
+                    standings = {}
+                standings_payload.append({
+                    'league': league_key,
+                    **standings
                 })
+                stale = stale or league_stale
+                cache_age = max(cache_age, league_age)
 
-            payload = {
-                'standings': snapshot.get('standings') or {},
+            return self._send_json(200, {
+                'standings': standings_payload,
                 'meta': {
-                    'league': league,
+                    'count': len(standings_payload),
+                    'league': 'all',
                     'season': season or 'current',
                     'cacheAgeSec': cache_age,
-                    'stale': stale,
-                    'upstreamBase': snapshot.get('last_source')
+                    'stale': stale
                 }
+            })
+
+        snapshot, cache_age, cache_ok, stale = get_standings(league, season=season, force_refresh=force_refresh)
+        if not cache_ok:
+            return self._send_json(502, {
+                'error': 'upstream_unavailable',
+                'message': snapshot.get('last_error'),
+                'standings': []
+            })
+
+        payload = {
+            'standings': snapshot.get('standings') or {},
+            'meta': {
+                'league': league,
+                'season': season or 'current',
+                'cacheAgeSec': cache_age,
+                'stale': stale,
+                'upstreamBase': snapshot.get('last_source')
             }
-            return self._send_json(200, payload)
-
-        if path == '/games':
-            filter_value = (query.get('filter') or ['all'])[0]
-            include_health = (query.get('includeHealth') or ['0'])[0] in ('1', 'true', 'yes')
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
-            league = (query.get('league') or ['all'])[0].lower()
-
-            snapshot, cache_age, cache_ok, stale = build_match_cache(force_refresh=force_refresh)
-            if not cache_ok:
-                return self._send_json(502, {
-                    'error': 'upstream_unavailable',
-                    'message': snapshot.get('last_error'),
-                    'games': []
-                })
+        }
+        return self._send_json(200, payload)
+
+    def _handle_games(self, query):
+        filter_value = query.get('filter', 'all')
+        include_health = query.get('includeHealth', '0') in TRUE_VALUES
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+        league = query.get('league', 'all').lower()
+
+        snapshot, cache_age, cache_ok, stale = build_match_cache(force_refresh=force_refresh)
+        if not cache_ok:
+            return self._send_json(502, {
+                'error': 'upstream_unavailable',
+                'message': snapshot.get('last_error'),
+                'games': []
+            })
 
+        # Identical snapshot + query knobs produce identical bytes, so
+        # reuse the serialized response briefly (cacheAgeSec in meta can
+        # lag by up to the response TTL).
+        cached = None
+        cache_key = None
+        if not force_refresh:
+            cache_key = (snapshot.get('last_fetch'), league, filter_value, include_health)
+            cached = GAMES_RESPONSE_CACHE.get(cache_key)
+        if cached is None:
             if league == 'all':
                 games = build_games_for_all(snapshot)
             else:
@@ -2644,68 +3691,162 @@ class RequestHandler(BaseHTTPRequestHandler):
                     'upstreamBase': snapshot.get('last_source')
                 }
             }
-            return self._send_json(200, payload)
-
-        if path.startswith('/games/'):
-            slug = unquote(path.split('/games/', 1)[1])
-            include_health = (query.get('includeHealth') or ['0'])[0] in ('1', 'true', 'yes')
-            force_refresh = (query.get('force') or ['0'])[0] in ('1', 'true', 'yes')
-            league = (query.get('league') or ['all'])[0].lower()
-
-            snapshot, cache_age, cache_ok, stale = build_match_cache(force_refresh=force_refresh)
-            if not cache_ok:
-                return self._send_json(502, {
-                    'error': 'upstream_unavailable',
-                    'message': snapshot.get('last_error')
-                })
+            body = json_dump_bytes(payload)
+            cached = (body, f'W/"{hashlib.md5(body).hexdigest()}"')
+            if cache_key is not None:
+                GAMES_RESPONSE_CACHE.set(cache_key, cached)
+        body, etag = cached
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return None
+        return self._send_json_bytes(200, body, etag)
+
+    def _handle_game_detail(self, path, query):
+        slug = unquote(path.split('/games/', 1)[1])
+        include_health = query.get('includeHealth', '0') in TRUE_VALUES
+        force_refresh = query.get('force', '0') in TRUE_VALUES
+        league = query.get('league', 'all').lower()
+
+        snapshot, cache_age, cache_ok, stale = build_match_cache(force_refresh=force_refresh)
+        if not cache_ok:
+            return self._send_json(502, {
+                'error': 'upstream_unavailable',
+                'message': snapshot.get('last_error')
+            })
 
-            if league == 'all':
-                games = build_games_for_all(snapshot)
-            else:
-                games = build_games_for_league(snapshot, league)
+        if league == 'all':
+            games = build_games_for_all(snapshot)
+        else:
+            games = build_games_for_league(snapshot, league)
 
-            if include_health:
-                games = apply_health_to_games(games)
+        # Index the plain list before health annotation; positions stay
+        # valid because apply_health_to_games preserves order.
+        slug_index = get_slug_index(snapshot, league, games)
+        if include_health:
+            games = apply_health_to_games(games)
 
-            match = find_game_by_slug(games, slug)
-            if not match:
-                return self._send_json(404, {'error': 'not_found'})
+        match = find_game_by_slug(games, slug, index=slug_index)
+        if not match:
+            return self._send_json(404, {'error': 'not_found'})
 
-            payload = {
-                'game': match,
-                'meta': {
-                    'cacheAgeSec': cache_age,
-                    'stale': stale,
-                    'upstreamBase': snapshot.get('last_source'),
-                    'league': league
-                }
+        payload = {
+            'game': match,
+            'meta': {
+                'cacheAgeSec': cache_age,
+                'stale': stale,
+                'upstreamBase': snapshot.get('last_source'),
+                'league': league
             }
-            return self._send_json(200, payload)
+        }
+        return self._send_json(200, payload)
 
-        if path == '/streams/check':
-            slug = (query.get('slug') or [''])[0]
-            source = (query.get('source') or ['admin'])[0]
-            try:
-                stream_id = int((query.get('stream') or ['1'])[0])
-            except ValueError:
-                stream_id = 1
-            health = check_source_health(source, slug, stream_id)
-            return self._send_json(200, {
-                'slug': slug,
-                'source': source,
-                'stream': stream_id,
-                'health': health
-            })
+    def _handle_stream_check(self, query):
+        slug = query.get('slug', '')
+        source = query.get('source', 'admin')
+        try:
+            stream_id = int(query.get('stream', '1'))
+        except ValueError:
+            stream_id = 1
+        health = check_source_health(source, slug, stream_id)
+        return self._send_json(200, {
+            'slug': slug,
+            'source': source,
+            'stream': stream_id,
+            'health': health
+        })
+
+    # Exact-path dispatch table; /games/<slug> is the only prefix route.
+    ROUTES = {
+        '/health': _handle_health,
+        '/teams': _handle_teams,
+        '/stats': _handle_stats,
+        '/players': _handle_players,
+        '/leaders': _handle_leaders,
+        '/standings': _handle_standings,
+        '/games': _handle_games,
+        '/streams/check': _handle_stream_check,
+    }
 
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        # First occurrence wins, matching the old parse_qs()[0] behavior,
+        # without wrapping every value in a single-item list.
+        query = {}
+        for key, value in parse_qsl(parsed.query):
+            query.setdefault(key, value)
+
+        handler = self.ROUTES.get(path)
+        if handler is not None:
+            return handler(self, query)
+        if path.startswith('/games/'):
+            return self._handle_game_detail(path, query)
         self._send_json(404, {'error': 'not_found'})
 
     def log_message(self, format, *args):
         logging.info('%s - %s', self.address_string(), format % args)
 
 
+def prewarm_caches():
+    # Warm every league's team and standings caches off the request
+    # path so dashboards hitting several leagues never serialize cold
+    # refreshes behind each other; the fan-out rides the refresh pool
+    # and the shared connection pool. Re-arms itself ahead of the
+    # shorter (standings) TTL.
+    for league in ESPN_TEAM_ENDPOINTS:
+        # Teams live on a much longer TTL than the timer cadence; only
+        # refetch when the cache is approaching expiry.
+        cache = TEAM_CACHES.get(league)
+        snapshot = cache.snapshot() if cache else {}
+        age = int(time.time()) - int(snapshot.get('last_fetch') or 0)
+        if age < int(TEAM_CACHE_TTL_SEC * 0.9):
+            continue
+        start_revalidation(f"teams:{league}", lambda league=league: refresh_teams(league))
+    for league in ESPN_STANDINGS_ENDPOINTS:
+        start_revalidation(
+            f"standings:{league}:current",
+            lambda league=league: refresh_standings(league)
+        )
+    timer = threading.Timer(max(60, int(STANDINGS_CACHE_TTL_SEC * 0.9)), prewarm_caches)
+    timer.daemon = True
+    timer.start()
+
+
+def prewarm_matches():
+    # Matches turn over on a much shorter TTL than teams/standings, so
+    # they re-arm on their own cadence just inside it; requests then
+    # land on a warm snapshot instead of paying the upstream fetch.
+    start_revalidation('matches', refresh_matches)
+    timer = threading.Timer(max(10, int(CACHE_TTL_SEC * 0.9)), prewarm_matches)
+    timer.daemon = True
+    timer.start()
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
 def run_server(port):
-    server = ThreadingHTTPServer(('0.0.0.0', port), RequestHandler)
-    logging.info('Python service listening on port %s', port)
+    multi_process = (
+        SERVICE_WORKERS > 1
+        and hasattr(os, 'fork')
+        and hasattr(socket, 'SO_REUSEPORT')
+    )
+    if multi_process:
+        # Fork before binding so every worker owns its own SO_REUSEPORT
+        # listener; children break out instead of forking further.
+        for _ in range(SERVICE_WORKERS - 1):
+            if os.fork() == 0:
+                break
+    server_cls = ReusePortHTTPServer if multi_process else ThreadingHTTPServer
+    server = server_cls(('0.0.0.0', port), RequestHandler)
+    logging.info('Python service listening on port %s (pid %s)', port, os.getpid())
+    prewarm_caches()
+    prewarm_matches()
     server.serve_forever()
 
 